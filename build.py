@@ -6,59 +6,193 @@ This script builds the Windows executable locally for testing purposes.
 Note: This utility is Windows-only as Komorebi window manager is only available for Windows.
 """
 
+import argparse
+import importlib.metadata
+import importlib.util
 import os
+import socket
 import sys
 import subprocess
 import platform
-from pathlib import Path
 import shutil
+from pathlib import Path
 import time
+from collections import deque
+
+IS_WINDOWS = sys.platform == "win32"
+PLATFORM_DESCRIPTION = f"{platform.system()} {platform.release()}"
+
+# Build definition (hidden imports, excludes, bundle filtering) lives only here
+SPEC_FILE = "komorebi-indicator.spec"
+
+# Oldest PyInstaller release this build is expected to work with
+MIN_PYINSTALLER_VERSION = (6, 0)
+
+# Number of trailing output lines kept from a build step for error reports
+OUTPUT_TAIL_LINES = 200
+
+def run_command(argv, description):
+    """Run a command (given as an argv list, no shell) and handle errors.
 
-def run_command(cmd, description):
-    """Run a command and handle errors."""
+    Output is streamed line by line and only the last OUTPUT_TAIL_LINES are
+    kept, so a long PyInstaller log is never held in memory in full. The
+    tail is printed only if the command fails.
+    """
     print(f"[RUNNING] {description}...")
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
     try:
-        result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        print(f"[SUCCESS] {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
+        with subprocess.Popen(
+            argv,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        ) as proc:
+            for line in proc.stdout:
+                tail.append(line)
+        returncode = proc.returncode
+    except OSError as e:
         print(f"[ERROR] {description} failed:")
-        print(f"   Command: {cmd}")
-        print(f"   Error: {e.stderr}")
+        print(f"   Command: {subprocess.list2cmdline(argv)}")
+        print(f"   Error: {e}")
+        return False
+
+    if returncode != 0:
+        print(f"[ERROR] {description} failed (exit code {returncode}):")
+        print(f"   Command: {subprocess.list2cmdline(argv)}")
+        print("".join(tail), end="")
         return False
 
+    print(f"[SUCCESS] {description} completed successfully")
+    return True
+
+def run_pyinstaller(args, description):
+    """
+    Run PyInstaller inside this interpreter to skip a second Python startup.
+
+    Falls back to a "python -m PyInstaller" subprocess if PyInstaller cannot
+    be imported here (for example right after a fresh install into another
+    site directory).
+    """
+    importlib.invalidate_caches()
+    try:
+        import PyInstaller.__main__
+    except ImportError:
+        return run_command([sys.executable, "-m", "PyInstaller"] + args, description)
+
+    print(f"[RUNNING] {description}...")
+    try:
+        PyInstaller.__main__.run(args)
+    except SystemExit as e:
+        # PyInstaller calls sys.exit() on errors
+        if e.code not in (None, 0):
+            print(f"[ERROR] {description} failed (exit code {e.code})")
+            return False
+    except Exception as e:
+        print(f"[ERROR] {description} failed:")
+        print(f"   Error: {e}")
+        return False
+    print(f"[SUCCESS] {description} completed successfully")
+    return True
+
+def _retry(func, path, attempts=3, delay=0.05):
+    """Call func(path), retrying briefly on transient Windows sharing errors."""
+    for attempt in range(attempts):
+        try:
+            func(path)
+            return
+        except FileNotFoundError:
+            return  # Already gone
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(delay)
+
+def _schedule_delete_on_reboot(path):
+    """Ask Windows to delete a locked path at next reboot. Returns success."""
+    if not IS_WINDOWS:
+        return False
+    import ctypes
+    MOVEFILE_DELAY_UNTIL_REBOOT = 0x4
+    return bool(ctypes.windll.kernel32.MoveFileExW(str(path), None, MOVEFILE_DELAY_UNTIL_REBOOT))
+
+def _rmtree(path):
+    """
+    Remove a directory tree bottom-up, one entry at a time.
+
+    Each unlink/rmdir is retried on its own, so a single file held open by an
+    AV scanner or a just-closed handle costs a few milliseconds instead of
+    restarting the whole removal.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _rmtree(entry.path)
+            else:
+                try:
+                    _retry(os.unlink, entry.path)
+                except PermissionError:
+                    if not _schedule_delete_on_reboot(entry.path):
+                        raise
+                    print(f"[WARNING] {entry.path} is locked, scheduled for deletion on reboot")
+    _retry(os.rmdir, path)
+
 def safe_remove_directory(path):
     """Safely remove a directory with retry logic for Windows."""
     if not Path(path).exists():
         return True
     
     print(f"[CLEANUP] Removing previous {path} directory...")
-    max_retries = 3
-    for attempt in range(max_retries):
-        try:
-            shutil.rmtree(path)
-            print(f"[SUCCESS] Successfully removed {path}")
-            return True
-        except PermissionError as e:
-            if attempt < max_retries - 1:
-                print(f"[WARNING] Permission error removing {path}, retrying in 2 seconds... (attempt {attempt + 1}/{max_retries})")
-                time.sleep(2)
-            else:
-                print(f"[ERROR] Failed to remove {path} after {max_retries} attempts: {e}")
-                print(f"   Please close any applications that might be using files in {path}")
-                return False
-        except Exception as e:
-            print(f"[ERROR] Error removing {path}: {e}")
-            return False
+    try:
+        _rmtree(path)
+        print(f"[SUCCESS] Successfully removed {path}")
+        return True
+    except PermissionError as e:
+        print(f"[ERROR] Failed to remove {path}: {e}")
+        print(f"   Please close any applications that might be using files in {path}")
+        return False
+    except Exception as e:
+        print(f"[ERROR] Error removing {path}: {e}")
+        return False
+
+def get_pyinstaller_version():
+    """Return the installed PyInstaller version as a tuple, or None if missing."""
+    if importlib.util.find_spec("PyInstaller") is None:
+        return None
+    try:
+        version = importlib.metadata.version("pyinstaller")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    parts = []
+    for part in version.split("."):
+        if not part.isdigit():
+            break
+        parts.append(int(part))
+    return tuple(parts)
+
+def parse_arguments():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Build the Komorebi Floating Workspace Indicator executable"
+    )
+    parser.add_argument(
+        '--clean',
+        action='store_true',
+        help="Remove the build/ directory and PyInstaller cache for a full rebuild"
+    )
+    return parser.parse_args()
 
 def main():
     """Main build function."""
+    args = parse_arguments()
+    
     print("[BUILD] Starting local build for Komorebi Floating Workspace Indicator")
-    print(f"[INFO] Platform: {platform.system()} {platform.release()}")
+    print(f"[INFO] Platform: {PLATFORM_DESCRIPTION}")
     print(f"[INFO] Python: {sys.version}")
     
     # Check if we're on Windows
-    if platform.system() != "Windows":
+    if not IS_WINDOWS:
         print("[ERROR] This utility is Windows-only as Komorebi window manager is only available for Windows.")
         return 1
     
@@ -68,30 +202,54 @@ def main():
         return 1
     
     # Use Python 3's pip explicitly to avoid Python 2.7 conflicts
-    pip_cmd = f"{sys.executable} -m pip"
+    pip_cmd = [sys.executable, "-m", "pip"]
     
-    # Install PyInstaller if not already installed
-    if not run_command(f"{pip_cmd} install pyinstaller", "Installing PyInstaller"):
-        return 1
+    # Install PyInstaller only if it is missing or too old
+    installed = get_pyinstaller_version()
+    if installed is None or installed < MIN_PYINSTALLER_VERSION:
+        pip_install = pip_cmd + [
+            "install",
+            "--disable-pip-version-check",
+            "--no-input",
+            "--quiet",
+            "--upgrade",
+            "pyinstaller",
+        ]
+        if not run_command(pip_install, "Installing PyInstaller"):
+            return 1
+    else:
+        print(f"[INFO] PyInstaller {'.'.join(map(str, installed))} already installed")
     
-    # Clean previous build and dist directories with retry logic
-    for folder in ["build", "dist"]:
+    # Clean previous output with retry logic. build/ holds PyInstaller's
+    # analysis cache, so it is kept between runs unless --clean is given.
+    folders = ["build", "dist"] if args.clean else ["dist"]
+    for folder in folders:
         if not safe_remove_directory(folder):
             print(f"[WARNING] Continuing build despite failure to remove {folder}...")
     
-    # Build the executable using spec file or default command with hidden imports
-    # Note: Removed --windowed flag to allow console output for command line arguments
-    pyinstaller_cmd = (
-        f"{sys.executable} -m PyInstaller --console run.py --name komorebi-indicator "
-        "--hidden-import=PyQt6 --hidden-import=PyQt6.QtWidgets --hidden-import=PyQt6.QtGui --hidden-import=PyQt6.QtCore "
-        "--hidden-import=win32com.client --hidden-import=win32com.shell --hidden-import=psutil"
+    # Keep PyInstaller's bootloader/UPX cache in a stable per-host location
+    os.environ.setdefault(
+        "PYINSTALLER_CONFIG_DIR",
+        str(Path.home() / ".cache" / "pyinstaller" / socket.gethostname()),
     )
-    if Path("komorebi-indicator.spec").exists():
-        if not run_command(f"{sys.executable} -m PyInstaller komorebi-indicator.spec", "Building executable"):
-            return 1
+    
+    # Build the executable from the spec file
+    # Note: Removed --windowed flag to allow console output for command line arguments
+    pyinstaller_base = ["--noconfirm"]
+    if args.clean:
+        pyinstaller_base.append("--clean")
+    upx_path = shutil.which("upx")
+    if upx_path:
+        # Compress bundled binaries to shrink what the bootloader unpacks at launch
+        pyinstaller_base.extend(["--upx-dir", os.path.dirname(upx_path)])
+        print(f"[INFO] Using UPX from {upx_path}")
     else:
-        if not run_command(pyinstaller_cmd, "Building executable"):
-            return 1
+        print("[INFO] UPX not found on PATH, building without compression")
+    if not Path(SPEC_FILE).exists():
+        print(f"[ERROR] {SPEC_FILE} not found. It defines the executable build.")
+        return 1
+    if not run_pyinstaller(pyinstaller_base + [SPEC_FILE], "Building executable"):
+        return 1
     
     # Check if build was successful
     exe_path = Path("dist/komorebi-indicator.exe")
@@ -0,0 +1,75 @@
+# -*- mode: python ; coding: utf-8 -*-
+"""
+PyInstaller spec for the single-file komorebi-indicator.exe build.
+
+Used by build.py and the GitHub Actions workflow:
+
+    pyinstaller komorebi-indicator.spec
+"""
+
+# PyQt6.QtCore/QtGui/QtWidgets are found by PyInstaller's import analysis;
+# only modules it can miss are listed here.
+hiddenimports = [
+    "win32com.client",
+    "win32com.shell",
+    "psutil",
+]
+
+# Qt modules and stdlib GUI toolkits the indicator never imports
+excludes = [
+    "PyQt6.QtSql",
+    "PyQt6.QtNetwork",
+    "PyQt6.QtQml",
+    "PyQt6.QtQuick",
+    "PyQt6.QtMultimedia",
+    "PyQt6.QtPdf",
+    "tkinter",
+]
+
+# Qt data/plugin directories that are not needed by a label-only overlay
+unused_qt_prefixes = (
+    "PyQt6/Qt6/translations/",
+    "PyQt6/Qt6/plugins/sqldrivers/",
+)
+
+
+def keep_entry(entry):
+    """Return False for TOC entries under one of unused_qt_prefixes."""
+    return not entry[0].replace("\\", "/").startswith(unused_qt_prefixes)
+
+
+a = Analysis(
+    ["run.py"],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=False,
+)
+a.datas = [entry for entry in a.datas if keep_entry(entry)]
+a.binaries = [entry for entry in a.binaries if keep_entry(entry)]
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name="komorebi-indicator",
+    debug=False,
+    bootloader_ignore_signals=False,
+    # Symbol stripping relies on binutils' strip and is not recommended on Windows
+    strip=False,
+    # Used when UPX is available (build.py passes --upx-dir if upx is on PATH)
+    upx=True,
+    # Binaries known to break or lose their signature when UPX-compressed
+    upx_exclude=["vcruntime140.dll", "vcruntime140_1.dll", "python3*.dll", "qwindows.dll"],
+    runtime_tmpdir=None,
+    # Console build so command line flags (--stop, --list-processes) can print
+    console=True,
+)
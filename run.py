@@ -7,20 +7,63 @@ Run this script to start the floating workspace indicator application.
 
 import sys
 import os
-import argparse
+from types import SimpleNamespace
 
-# Add src directory to Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+IS_WINDOWS = sys.platform == "win32"
+
+_SCRIPT = os.path.abspath(__file__)
+_HERE = os.path.dirname(_SCRIPT)
+
+# Add src directory to Python path (a frozen build already has it bundled)
+if not getattr(sys, 'frozen', False):
+    sys.path.insert(0, os.path.join(_HERE, 'src'))
 
 # Import main only when needed to avoid initializing GUI components for command-line operations
 # Other imports are lightweight and can be imported immediately
 
-def parse_arguments():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(
-        description="Komorebi Floating Workspace Indicator",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+# Parsed-argument defaults; must match the dests/defaults in parse_arguments()
+_DEFAULT_ARGS = {
+    'template': "{workspace}",
+    'show_monitor': False,
+    'show_name': False,
+    'show_layout': False,
+    'config': None,
+    'log_level': None,
+    'verbose': False,
+    'debug': False,
+    'enable_autostart': False,
+    'disable_autostart': False,
+    'stop': False,
+    'force': False,
+    'list_processes': False,
+    'detached': False,
+    'foreground': False,
+}
+
+# Single flags that can be handled without building the argparse parser
+_FAST_PATH_FLAGS = {'--stop', '--list-processes', '--detached'}
+
+def fast_parse_arguments(argv):
+    """
+    Handle the common trivial invocations without importing argparse.
+
+    Args:
+        argv: Command line arguments (without the program name)
+
+    Returns:
+        Namespace-like object with parsed arguments, or None if argv needs
+        the full parser
+    """
+    if len(argv) > 1 or (argv and argv[0] not in _FAST_PATH_FLAGS):
+        return None
+    args = SimpleNamespace(**_DEFAULT_ARGS)
+    if argv:
+        setattr(args, argv[0][2:].replace('-', '_'), True)
+    return args
+
+_DESCRIPTION = "Komorebi Floating Workspace Indicator"
+
+_EPILOG = """
 Template Examples:
   --template "{workspace}"                    # Just workspace number
   --template "M{monitor} W{workspace}"        # Monitor and workspace
@@ -49,6 +92,15 @@ Process Management Examples:
   --stop --force                             # Force stop all running instances
   --list-processes                           # List all running instances
         """
+
+def parse_arguments():
+    """Parse command line arguments."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description=_DESCRIPTION,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     parser.add_argument(
@@ -161,8 +213,90 @@ def apply_show_flags_to_template(args):
     if len(parts) > 1:
         args.template = " ".join(parts)
 
+# Environment variable naming the event the background process sets once it is
+# up; must match src.main.READY_EVENT_ENV
+READY_EVENT_ENV = "KOMOREBI_INDICATOR_READY_EVENT"
+READY_TIMEOUT_MS = 500
+
+def create_ready_event():
+    """
+    Create a named Windows event for the background process to signal.
+
+    Returns:
+        (name, handle) tuple, or (None, None) if the event could not be created
+    """
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.windll.kernel32
+    kernel32.CreateEventW.restype = wintypes.HANDLE
+    name = f"komorebi-indicator-ready-{os.getpid()}"
+    handle = kernel32.CreateEventW(None, True, False, name)
+    if not handle:
+        return None, None
+    return name, handle
+
+def wait_for_ready(handle, timeout_ms=READY_TIMEOUT_MS):
+    """Wait until the background process signals (or the timeout passes), then close the event."""
+    if not handle:
+        return
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.windll.kernel32
+    kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    kernel32.WaitForSingleObject(handle, timeout_ms)
+    kernel32.CloseHandle(handle)
+
+def ready_event_env(event_name):
+    """Environment for the background process, carrying the ready event name."""
+    if not event_name:
+        return None
+    return dict(os.environ, **{READY_EVENT_ENV: event_name})
+
+def fast_exit(code):
+    """Flush the console streams and exit immediately, skipping interpreter teardown."""
+    for stream in (sys.stdout, sys.stderr):
+        # Streams are None in a windowed (no console) frozen build
+        if stream is not None:
+            stream.flush()
+    os._exit(code)
+
+def daemonize():
+    """
+    Fork into a new session with stdio on /dev/null (POSIX only).
+
+    Returns:
+        True in the parent, False in the detached child
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if os.fork() > 0:
+        return True
+    os.setsid()
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.close(devnull)
+    return False
+
+def run_gui(settings):
+    """Start the GUI application in this process and return its exit code."""
+    # Imported here so CLI-only paths never load PyQt6
+    from src.main import main
+    from src.template import compile_template
+    return main(
+        template=settings.template, 
+        show_monitor=settings.show_monitor, 
+        show_name=settings.show_name,
+        show_layout=settings.show_layout,
+        log_level=settings.log_level,
+        opacity=settings.opacity,
+        poll_interval_ms=settings.poll_interval_ms,
+        render=compile_template(settings.template) if settings.template else None,
+    )
+
 if __name__ == "__main__":
-    args = parse_arguments()
+    args = fast_parse_arguments(sys.argv[1:]) or parse_arguments()
     
     # Enable logging early when user requested it, so config load messages are visible
     if not (args.list_processes or args.stop or args.enable_autostart or args.disable_autostart):
@@ -213,9 +347,7 @@ if __name__ == "__main__":
                     print(f"  PID {proc['pid']}: {proc['name']}{current_marker}")
                     print(f"    Command: {proc['cmdline']}")
         finally:
-            sys.stdout.flush()
-            sys.stderr.flush()
-            os._exit(0)  # Force immediate exit without cleanup
+            fast_exit(0)
     
     if args.stop:
         from src.process_manager import stop_all_app_processes, get_process_count
@@ -225,9 +357,7 @@ if __name__ == "__main__":
             
             if process_count == 0:
                 print("No running application processes found to stop.")
-                sys.stdout.flush()
-                sys.stderr.flush()
-                os._exit(0)
+                fast_exit(0)
                 
             print(f"Found {process_count} running process(es) to stop...")
             results = stop_all_app_processes(force=args.force, timeout=10)
@@ -246,9 +376,7 @@ if __name__ == "__main__":
             
             exit_code = 0 if (results['stopped'] > 0 and results['failed'] == 0) else 1
         finally:
-            sys.stdout.flush()
-            sys.stderr.flush()
-            os._exit(exit_code if 'exit_code' in locals() else 1)
+            fast_exit(exit_code if 'exit_code' in locals() else 1)
     
     # Handle autostart commands
     if args.enable_autostart:
@@ -264,9 +392,7 @@ if __name__ == "__main__":
                 print("[ERROR] Failed to enable autostart")
                 exit_code = 1
         finally:
-            sys.stdout.flush()
-            sys.stderr.flush()
-            os._exit(exit_code if 'exit_code' in locals() else 1)
+            fast_exit(exit_code if 'exit_code' in locals() else 1)
     
     if args.disable_autostart:
         from src.autostart import disable_autostart, get_autostart_status
@@ -281,13 +407,10 @@ if __name__ == "__main__":
                 print("[ERROR] Failed to disable autostart")
                 exit_code = 1
         finally:
-            sys.stdout.flush()
-            sys.stderr.flush()
-            os._exit(exit_code if 'exit_code' in locals() else 1)
+            fast_exit(exit_code if 'exit_code' in locals() else 1)
     
     # Default behavior: start as background service and return to command prompt
     import subprocess
-    import time
     
     # Use log_level from settings (already merged with CLI)
     log_level = settings.log_level
@@ -327,20 +450,32 @@ if __name__ == "__main__":
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             startupinfo.wShowWindow = subprocess.SW_HIDE
             
-            # Use CREATE_NEW_PROCESS_GROUP to detach from current console
-            creation_flags = subprocess.CREATE_NEW_PROCESS_GROUP
-            
-            process = subprocess.Popen(
-                cmd_args,
-                creationflags=creation_flags,
+            # Detach from the current console and its process group. CreateProcess
+            # reports failure synchronously; the ready event only bounds how long
+            # we wait for the child to finish starting up.
+            creation_flags = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            event_name, event_handle = create_ready_event()
+            popen_kwargs = dict(
+                env=ready_event_env(event_name),
                 startupinfo=startupinfo,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
-                stdin=subprocess.DEVNULL
+                stdin=subprocess.DEVNULL,
+                close_fds=True,
             )
             
-            # Give the process a moment to start
-            time.sleep(0.5)
+            try:
+                # Also leave the console's job object so closing the terminal
+                # does not take the background service down with it
+                process = subprocess.Popen(
+                    cmd_args,
+                    creationflags=creation_flags | subprocess.CREATE_BREAKAWAY_FROM_JOB,
+                    **popen_kwargs
+                )
+            except PermissionError:
+                # The job does not allow breakaway; start inside it instead
+                process = subprocess.Popen(cmd_args, creationflags=creation_flags, **popen_kwargs)
+            wait_for_ready(event_handle)
             
             print(f"Komorebi Workspace Indicator started as background service (PID: {process.pid})")
             print("Use 'komorebi-indicator.exe --stop' to stop all running instances")
@@ -350,59 +485,56 @@ if __name__ == "__main__":
             sys.exit(1)
         
         # Exit immediately to return user to command prompt
-        sys.stdout.flush()
-        sys.stderr.flush()
-        os._exit(0)
+        fast_exit(0)
         
     elif not is_detached:
         # Running as Python script - use subprocess to detach
+        is_parent = True
         try:
-            import platform
-            if platform.system() == "Windows":
-                # Use PowerShell Start-Process for detachment
-                script_path = os.path.abspath(__file__)
-                ps_cmd = f'Start-Process -FilePath "python" -ArgumentList \'"{script_path}", "--detached"\' -WindowStyle Hidden'
-                subprocess.run(['powershell', '-Command', ps_cmd], check=True)
+            if IS_WINDOWS:
+                # Start the detached process directly; no console window is created
+                event_name, event_handle = create_ready_event()
+                subprocess.Popen(
+                    [sys.executable, _SCRIPT, '--detached'],
+                    creationflags=subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+                    env=ready_event_env(event_name),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    stdin=subprocess.DEVNULL,
+                    close_fds=True,
+                )
+                wait_for_ready(event_handle)
                 print("Komorebi Workspace Indicator started as background service")
                 print("Use 'python run.py --stop' to stop all running instances")
             else:
-                # Unix-like systems
-                subprocess.Popen([sys.executable, __file__, '--detached'], 
-                               stdout=subprocess.DEVNULL, 
-                               stderr=subprocess.DEVNULL,
-                               stdin=subprocess.DEVNULL,
-                               start_new_session=True)
-                print("Komorebi Workspace Indicator started as background service")
-                print("Use 'python run.py --stop' to stop all running instances")
+                # Unix-like systems: fork and keep running in the child, so the
+                # GUI starts without bootstrapping a second interpreter
+                try:
+                    is_parent = daemonize()
+                except OSError:
+                    subprocess.Popen([sys.executable, _SCRIPT, '--detached'], 
+                                   stdout=subprocess.DEVNULL, 
+                                   stderr=subprocess.DEVNULL,
+                                   stdin=subprocess.DEVNULL,
+                                   start_new_session=True)
+                    is_parent = True
+                if is_parent:
+                    print("Komorebi Workspace Indicator started as background service")
+                    print("Use 'python run.py --stop' to stop all running instances")
                 
         except Exception as e:
             print(f"[ERROR] Failed to start background service: {e}")
             # Fallback to direct execution
-            from src.main import main
-            sys.exit(main(
-                template=settings.template, 
-                show_monitor=settings.show_monitor, 
-                show_name=settings.show_name,
-                show_layout=settings.show_layout,
-                log_level=settings.log_level,
-                opacity=settings.opacity,
-                poll_interval_ms=settings.poll_interval_ms,
-            ))
+            sys.exit(run_gui(settings))
+        
+        if not is_parent:
+            # Forked child: run the GUI outside the try so its errors are not
+            # mistaken for a failed launch and retried
+            sys.exit(run_gui(settings))
         
         # Exit immediately to return user to command prompt
-        sys.stdout.flush()
-        sys.stderr.flush()
-        os._exit(0)
+        fast_exit(0)
     
     else:
         # We are the detached process - run the actual GUI application
-        from src.main import main
-        sys.exit(main(
-            template=settings.template, 
-            show_monitor=settings.show_monitor, 
-            show_name=settings.show_name,
-            show_layout=settings.show_layout,
-            log_level=settings.log_level,
-            opacity=settings.opacity,
-            poll_interval_ms=settings.poll_interval_ms,
-        )) 
\ No newline at end of file
+        sys.exit(run_gui(settings)) 
\ No newline at end of file
@@ -20,6 +20,9 @@ if __name__ == "__main__":
             "pywin32>=305",
         ],
         extras_require={
+            "fast": [
+                "orjson>=3.9.0",
+            ],
             "dev": [
                 "pytest>=7.0.0",
                 "ruff>=0.1.0",
@@ -8,18 +8,29 @@ on each monitor, integrated with the Komorebi window manager.
 __version__ = "1.0.0"
 __author__ = "Komorebi Indicator Team"
 
-from .floating_window_manager import FloatingWindowManager, WorkspaceIndicator
-from .komorebi_client import KomorebiClient, WorkspaceState
-from .main import KomorebiIndicatorApp, main
-from .monitor_manager import MonitorInfo, MonitorManager
+# Public names are imported on first access so that CLI-only paths
+# (e.g. --stop, --list-processes) that import src.config or
+# src.process_manager do not pull in PyQt6 and pywin32.
+_EXPORTS = {
+    "KomorebiClient": ".komorebi_client",
+    "WorkspaceState": ".komorebi_client",
+    "MonitorManager": ".monitor_manager",
+    "MonitorInfo": ".monitor_manager",
+    "FloatingWindowManager": ".floating_window_manager",
+    "WorkspaceIndicator": ".floating_window_manager",
+    "KomorebiIndicatorApp": ".main",
+    "main": ".main",
+}
 
-__all__ = [
-    "KomorebiClient",
-    "WorkspaceState",
-    "MonitorManager",
-    "MonitorInfo",
-    "FloatingWindowManager",
-    "WorkspaceIndicator",
-    "KomorebiIndicatorApp",
-    "main",
-]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
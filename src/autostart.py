@@ -10,17 +10,39 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-try:
-    import win32com.client
-    import win32api
-    import win32con
-    from win32com.shell import shell, shellcon
-    WIN32_AVAILABLE = True
-except ImportError:
-    WIN32_AVAILABLE = False
-
 logger = logging.getLogger(__name__)
 
+# Running as a PyInstaller executable, and what the shortcut should launch
+IS_FROZEN = bool(getattr(sys, 'frozen', False))
+EXECUTABLE_PATH = (
+    Path(sys.executable) if IS_FROZEN
+    else Path(__file__).resolve().parent.parent / "run.py"  # point to run.py
+)
+
+# pywin32 modules, populated on first use by _load_win32()
+win32com = None
+shell = None
+shellcon = None
+WIN32_AVAILABLE: Optional[bool] = None
+
+
+def _load_win32() -> bool:
+    """
+    Import the pywin32 modules needed for shortcuts on first use.
+    
+    Returns:
+        True if pywin32 is available, False otherwise
+    """
+    global win32com, shell, shellcon, WIN32_AVAILABLE
+    if WIN32_AVAILABLE is None:
+        try:
+            import win32com.client
+            from win32com.shell import shell, shellcon
+            WIN32_AVAILABLE = True
+        except ImportError:
+            WIN32_AVAILABLE = False
+    return WIN32_AVAILABLE
+
 
 class AutostartManager:
     """Manages Windows autostart functionality for the application."""
@@ -29,15 +51,25 @@ class AutostartManager:
         """Initialize the autostart manager."""
         self.app_name = "komorebi-workspace-indicator"
         self.shortcut_name = f"{self.app_name}.lnk"
+        self._resolve_paths()
         
-    def get_startup_folder(self) -> Optional[Path]:
+    def _resolve_paths(self):
+        """Look up the startup folder once and cache it with the shortcut path."""
+        self._startup_folder = self._query_startup_folder()
+        self._shortcut_path = (
+            self._startup_folder / self.shortcut_name if self._startup_folder else None
+        )
+        # Shortcut state is tracked here; enable/disable keep it in sync
+        self._enabled = bool(self._shortcut_path and self._shortcut_path.exists())
+        
+    def _query_startup_folder(self) -> Optional[Path]:
         """
-        Get the Windows startup folder path.
+        Query the Windows startup folder path from the shell.
         
         Returns:
             Path to the startup folder, or None if unavailable
         """
-        if not WIN32_AVAILABLE:
+        if not _load_win32():
             logger.error("Win32 libraries not available")
             return None
             
@@ -49,6 +81,19 @@ class AutostartManager:
             logger.error(f"Failed to get startup folder: {e}")
             return None
     
+    def invalidate_cache(self):
+        """Re-resolve the startup folder and re-check the shortcut on disk."""
+        self._resolve_paths()
+        
+    def get_startup_folder(self) -> Optional[Path]:
+        """
+        Get the Windows startup folder path.
+        
+        Returns:
+            Path to the startup folder, or None if unavailable
+        """
+        return self._startup_folder
+    
     def get_shortcut_path(self) -> Optional[Path]:
         """
         Get the full path to the shortcut file.
@@ -56,10 +101,7 @@ class AutostartManager:
         Returns:
             Path to the shortcut file, or None if startup folder unavailable
         """
-        startup_folder = self.get_startup_folder()
-        if startup_folder is None:
-            return None
-        return startup_folder / self.shortcut_name
+        return self._shortcut_path
     
     def get_executable_path(self) -> Path:
         """
@@ -68,13 +110,7 @@ class AutostartManager:
         Returns:
             Path to the executable or script
         """
-        # Check if we're running as a PyInstaller executable
-        if getattr(sys, 'frozen', False):
-            return Path(sys.executable)
-        else:
-            # Running as a Python script - point to run.py
-            script_dir = Path(__file__).parent.parent
-            return script_dir / "run.py"
+        return EXECUTABLE_PATH
     
     def is_autostart_enabled(self) -> bool:
         """
@@ -83,10 +119,7 @@ class AutostartManager:
         Returns:
             True if autostart shortcut exists, False otherwise
         """
-        shortcut_path = self.get_shortcut_path()
-        if shortcut_path is None:
-            return False
-        return shortcut_path.exists()
+        return self._enabled
     
     def enable_autostart(self) -> bool:
         """
@@ -95,7 +128,7 @@ class AutostartManager:
         Returns:
             True if successful, False otherwise
         """
-        if not WIN32_AVAILABLE:
+        if not _load_win32():
             logger.error("Cannot enable autostart: Win32 libraries not available")
             return False
             
@@ -105,25 +138,26 @@ class AutostartManager:
                 logger.error("Cannot get startup folder path")
                 return False
                 
-            executable_path = self.get_executable_path()
+            # Serialize the paths once for the COM shortcut properties
+            exe_str = str(EXECUTABLE_PATH)
+            exe_parent_str = str(EXECUTABLE_PATH.parent)
             
             # Create the shortcut using COM
             shell_obj = win32com.client.Dispatch("WScript.Shell")
             shortcut = shell_obj.CreateShortCut(str(shortcut_path))
             
-            if getattr(sys, 'frozen', False):
+            if IS_FROZEN:
                 # Running as executable
-                shortcut.Targetpath = str(executable_path)
-                shortcut.WorkingDirectory = str(executable_path.parent)
+                shortcut.Targetpath = exe_str
             else:
                 # Running as Python script
-                python_exe = sys.executable
-                shortcut.Targetpath = python_exe
-                shortcut.Arguments = f'"{executable_path}"'
-                shortcut.WorkingDirectory = str(executable_path.parent)
+                shortcut.Targetpath = sys.executable
+                shortcut.Arguments = f'"{exe_str}"'
+            shortcut.WorkingDirectory = exe_parent_str
             
             shortcut.Description = "Komorebi Workspace Indicator"
             shortcut.save()
+            self._enabled = True
             
             logger.info(f"Autostart enabled: Created shortcut at {shortcut_path}")
             return True
@@ -150,6 +184,7 @@ class AutostartManager:
                 logger.info(f"Autostart disabled: Removed shortcut at {shortcut_path}")
             else:
                 logger.info("Autostart was not enabled (shortcut not found)")
+            self._enabled = False
                 
             return True
             
@@ -164,7 +199,7 @@ class AutostartManager:
         Returns:
             Status string
         """
-        if not WIN32_AVAILABLE:
+        if not _load_win32():
             return "Autostart unavailable (Win32 libraries missing)"
             
         shortcut_path = self.get_shortcut_path()
@@ -177,25 +212,32 @@ class AutostartManager:
             return "Autostart disabled"
 
 
+_manager: Optional[AutostartManager] = None
+
+
+def _get_manager() -> AutostartManager:
+    """Get the shared AutostartManager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        _manager = AutostartManager()
+    return _manager
+
+
 def enable_autostart() -> bool:
     """Enable autostart functionality."""
-    manager = AutostartManager()
-    return manager.enable_autostart()
+    return _get_manager().enable_autostart()
 
 
 def disable_autostart() -> bool:
     """Disable autostart functionality."""
-    manager = AutostartManager()
-    return manager.disable_autostart()
+    return _get_manager().disable_autostart()
 
 
 def is_autostart_enabled() -> bool:
     """Check if autostart is enabled."""
-    manager = AutostartManager()
-    return manager.is_autostart_enabled()
+    return _get_manager().is_autostart_enabled()
 
 
 def get_autostart_status() -> str:
     """Get autostart status string."""
-    manager = AutostartManager()
-    return manager.get_status() 
\ No newline at end of file
+    return _get_manager().get_status()
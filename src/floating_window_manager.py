@@ -6,24 +6,69 @@ using PyQt6. Provides always-on-top windows positioned at monitor top-center.
 """
 
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Set
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
-from PyQt6.QtWidgets import QApplication, QLabel, QMenu, QVBoxLayout, QWidget
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QFont, QFontMetrics
+from PyQt6.QtWidgets import QApplication, QLabel, QMenu, QWidget
 
 from .config import load_config
 from .komorebi_client import WorkspaceState
 from .monitor_manager import MonitorInfo
+from .template import TemplateRenderer, compile_template
 
 logger = logging.getLogger(__name__)
 
+# Indicator window and context menu style
+_WIDGET_QSS = """
+    QWidget {
+        background: transparent;
+        border: none;
+    }
+    QMenu {
+        background-color: #222;
+        color: #fff;
+        border-radius: 6px;
+        border: 1px solid #444;
+    }
+    QMenu::item:selected {
+        background-color: #444;
+    }
+"""
+
+# Indicator label style, applied once per label in WorkspaceIndicator._setup_ui
+# (keep _LABEL_PADDING in sync with the padding below)
+_LABEL_QSS = """
+    QLabel {
+        color: #2196F3;
+        background-color: rgba(0, 0, 0, 0.8);
+        border-radius: 4px;
+        padding: 8px 12px;
+    }
+"""
+_LABEL_PADDING = (12, 8)  # (horizontal, vertical) padding from _LABEL_QSS, in pixels
+
+
+@lru_cache(maxsize=None)
+def _label_font() -> QFont:
+    """Label font shared by all indicators (created lazily, after QApplication)."""
+    return QFont("Arial", 14, QFont.Weight.Bold)
+
+
+@lru_cache(maxsize=None)
+def _label_font_metrics() -> QFontMetrics:
+    """Font metrics for _label_font(), shared by all indicators."""
+    return QFontMetrics(_label_font())
+
 
 class WorkspaceIndicator(QWidget):
     """Individual workspace indicator widget for a single monitor."""
 
     DEFAULT_OPACITY = 0.7
     DEFAULT_TEMPLATE = "{workspace}"
+    MARGIN = 4  # Transparent border around the label, in pixels
+    UPDATE_DEBOUNCE_MS = 16  # Coalesce bursts of updates into one repaint (~1 frame)
 
     def __init__(
         self,
@@ -37,6 +82,8 @@ class WorkspaceIndicator(QWidget):
         komorebi_client=None,
         window_manager=None,
         opacity: Optional[float] = None,
+        render: Optional[TemplateRenderer] = None,
+        display_monitor: Optional[int] = None,
     ):
         """
         Initialize the workspace indicator.
@@ -57,14 +104,20 @@ class WorkspaceIndicator(QWidget):
             komorebi_client: KomorebiClient instance for workspace switching
             window_manager: Reference to FloatingWindowManager for refresh operations
             opacity: Window opacity (0.0 to 1.0), defaults to DEFAULT_OPACITY if None
+            render: Precompiled renderer for template (see template.compile_template);
+                    compiled from template if None
+            display_monitor: Monitor number shown for {monitor} (1-based);
+                             defaults to monitor_id if None
         """
         super().__init__(parent)
         self.monitor_info = monitor_info
         self.monitor_id = monitor_id  # Store the actual Komorebi monitor ID
+        self._display_monitor = display_monitor if display_monitor is not None else monitor_id
         self.current_workspace = 0  # 0-based internally
         self.current_workspace_name = None
         self.current_workspace_layout = None
         self.current_workspace_layout_flip = None
+        self._last_display_text = None  # Text currently shown by the label
         self.show_layout = show_layout
         self.komorebi_client = komorebi_client
         self.window_manager = window_manager  # Store reference to window manager
@@ -72,76 +125,80 @@ class WorkspaceIndicator(QWidget):
         # Dragging state
         self.user_moved = False  # Track if user has manually moved the window
 
-        # Set up template
+        # Set up template; a render compiled from an empty template does not apply to the default
         if template:
             self.template = template
+            self._render = render if render is not None else compile_template(template)
         else:
             self.template = self.DEFAULT_TEMPLATE
+            self._render = compile_template(self.template)
+
+        # Workspace updates are applied once per burst, after UPDATE_DEBOUNCE_MS
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(self.UPDATE_DEBOUNCE_MS)
+        self._update_timer.timeout.connect(self._apply_pending_update)
 
         # Set window class name to help Komorebi ignore this window
         self.setWindowTitle("KomorebiWorkspaceIndicator")
         
         self._setup_ui()
+        self._context_menu = self._build_context_menu()
         self._setup_window_properties()
         self.set_opacity(opacity if opacity is not None else self.DEFAULT_OPACITY)
 
     def _setup_ui(self):
         """Setup the user interface components."""
-        # Main layout
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(4, 4, 4, 4)
-        layout.setSpacing(0)
-
         # Set styling for the main widget to remove any borders
-        self.setStyleSheet("""
-            QWidget {
-                background: transparent;
-                border: none;
-            }
-            QMenu {
-                background-color: #222;
-                color: #fff;
-                border-radius: 6px;
-                border: 1px solid #444;
-            }
-            QMenu::item:selected {
-                background-color: #444;
-            }
-        """)
+        self.setStyleSheet(_WIDGET_QSS)
 
         # Monitor and workspace label
         initial_text = self._format_display_text(
             self.current_workspace, None, self.current_workspace_layout,
             self.current_workspace_layout_flip,
         )
-        self.workspace_label = QLabel(initial_text)
+        self.workspace_label = QLabel(initial_text, self)
+        self._last_display_text = initial_text
         self.workspace_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.workspace_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        self.workspace_label.setStyleSheet(
-            """
-            QLabel {
-                color: #2196F3;
-                background-color: rgba(0, 0, 0, 0.8);
-                border-radius: 4px;
-                padding: 8px 12px;
-            }
-        """
-        )
+        self.workspace_label.setFont(_label_font())
+        self._font_metrics = _label_font_metrics()
+        self.workspace_label.setStyleSheet(_LABEL_QSS)
 
         # Make the label draggable
         self.workspace_label.mousePressEvent = self._label_mouse_press
-        self.workspace_label.mouseMoveEvent = self._label_mouse_move
-        self.workspace_label.mouseReleaseEvent = self._label_mouse_release
         self.workspace_label.setCursor(Qt.CursorShape.OpenHandCursor)
 
-        layout.addWidget(self.workspace_label)
-
-        # Let the widget size itself to fit content
-        self.adjustSize()
+        # Size the widget to fit content
+        self._fit_to_label()
 
         # Position the window after sizing
         self._position_window()
 
+    def _measure(self, text: str):
+        """Return the (width, height) the label needs for text, padding included."""
+        pad_x, pad_y = _LABEL_PADDING
+        metrics = self._font_metrics
+        if "\n" not in text:
+            return (
+                metrics.horizontalAdvance(text) + 2 * pad_x,
+                metrics.height() + 2 * pad_y,
+            )
+        # Multi-line template: widest line, one line spacing per extra line
+        lines = text.split("\n")
+        return (
+            max(map(metrics.horizontalAdvance, lines)) + 2 * pad_x,
+            metrics.height() + (len(lines) - 1) * metrics.lineSpacing() + 2 * pad_y,
+        )
+
+    def _fit_to_label(self):
+        """Size the label to its text and the window to the label plus margin."""
+        width, height = self._measure(self.workspace_label.text())
+        label = self.workspace_label
+        if label.width() == width and label.height() == height and label.x() == self.MARGIN:
+            return  # Same footprint as before (e.g. "2" -> "3"): nothing to relayout
+        label.setGeometry(self.MARGIN, self.MARGIN, width, height)
+        self.resize(width + 2 * self.MARGIN, height + 2 * self.MARGIN)
+
     @staticmethod
     def _layout_flip_display(raw: Optional[str]) -> str:
         """Convert layout_flip from state to display: H, V, or HV."""
@@ -167,34 +224,16 @@ class WorkspaceIndicator(QWidget):
         # Convert to 1-based for display only
         display_workspace = workspace_index + 1
 
-        # For monitor display, convert Komorebi monitor ID to a display-friendly number
-        # We'll use the monitor ID directly, but if it's too large, we'll map it
-        display_monitor = self.monitor_id
-        if display_monitor > 100:  # If monitor ID is very large, use a simpler mapping
-            # Try to get a simpler display number based on monitor position
-            monitors = sorted(
-                self.komorebi_client.get_monitor_information() if self.komorebi_client else [],
-                key=lambda m: (m.size["left"], m.size["top"])
-            )
-            for i, monitor in enumerate(monitors):
-                if monitor.id == self.monitor_id:
-                    display_monitor = i + 1  # 1-based for display
-                    break
-
         layout_str = workspace_layout or ""
         flip_str = self._layout_flip_display(workspace_layout_flip)
 
-        return (
-            self.template.format(
-                monitor=display_monitor,
-                workspace=display_workspace,
-                name=workspace_name if workspace_name else "",
-                layout=layout_str,
-                flip=flip_str,
-            )
-            .strip()
-            .rstrip(":")
-        )  # Remove trailing colon if no name
+        return self._render({
+            "monitor": self._display_monitor,
+            "workspace": display_workspace,
+            "name": workspace_name if workspace_name else "",
+            "layout": layout_str,
+            "flip": flip_str,
+        })
 
     def _setup_window_properties(self):
         """Setup window properties for floating behavior."""
@@ -218,15 +257,17 @@ class WorkspaceIndicator(QWidget):
 
     def _position_window(self):
         """Position the window at the top-center of its monitor."""
-        left, top, right, bottom = self.monitor_info.rect
-        center_x = (left + right) // 2
+        monitor_info = self.monitor_info
+        center_x = (monitor_info.left + monitor_info.right) // 2
 
         # Position at top-center with slight offset
         x = center_x - (self.width() // 2)
-        y = top + 10  # 10px from top
+        y = monitor_info.top + 10  # 10px from top
 
-        self.move(x, y)
         self.user_moved = False  # Reset user_moved flag when repositioning
+        if self.x() == x and self.y() == y:
+            return  # Already there; avoid a no-op move round-trip to the WM
+        self.move(x, y)
         logger.info(f"Positioned indicator for monitor {self.monitor_id} at ({x}, {y})")
 
     def reset_position(self):
@@ -243,16 +284,6 @@ class WorkspaceIndicator(QWidget):
             logger.debug("Started dragging via window handle")
             event.accept()
 
-    def _label_mouse_move(self, event):
-        """Handle mouse move on the label for dragging."""
-        # This method is not needed when using startSystemMove()
-        pass
-
-    def _label_mouse_release(self, event):
-        """Handle mouse release on the label for dragging."""
-        # This method is not needed when using startSystemMove()
-        pass
-
     def update_workspace(
         self,
         workspace_index: int,
@@ -263,53 +294,45 @@ class WorkspaceIndicator(QWidget):
         """
         Update the displayed workspace information.
 
+        The label is refreshed by _apply_pending_update() once the debounce
+        timer fires, so only the last state of a burst gets rendered.
+
         Args:
             workspace_index: New workspace index (0-based)
             workspace_name: New workspace name (optional)
             workspace_layout: New workspace layout (optional, e.g. VerticalStack)
             workspace_layout_flip: Layout flip (Horizontal, Vertical, HorizontalAndVertical)
         """
-        if (
-            workspace_index != self.current_workspace
-            or workspace_name != self.current_workspace_name
-            or workspace_layout != self.current_workspace_layout
-            or workspace_layout_flip != self.current_workspace_layout_flip
-        ):
-            self.current_workspace = workspace_index
-            self.current_workspace_name = workspace_name
-            self.current_workspace_layout = workspace_layout
-            self.current_workspace_layout_flip = workspace_layout_flip
-
-            # Update display text
-            display_text = self._format_display_text(
-                workspace_index, workspace_name, workspace_layout,
-                workspace_layout_flip,
-            )
-            self.workspace_label.setText(display_text)
-
-            # Always use blue color
-            self.workspace_label.setStyleSheet(
-                """
-                QLabel {
-                    color: #2196F3;
-                    background-color: rgba(0, 0, 0, 0.8);
-                    border-radius: 4px;
-                    padding: 8px 12px;
-                }
-            """
-            )
+        self.current_workspace = workspace_index
+        self.current_workspace_name = workspace_name
+        self.current_workspace_layout = workspace_layout
+        self.current_workspace_layout_flip = workspace_layout_flip
+        self._update_timer.start()
+
+    def _apply_pending_update(self):
+        """Render the latest workspace state to the label."""
+        display_text = self._format_display_text(
+            self.current_workspace, self.current_workspace_name,
+            self.current_workspace_layout, self.current_workspace_layout_flip,
+        )
+        # Komorebi often re-reports the same state; leave Qt alone if nothing changed
+        if display_text == self._last_display_text:
+            return
+        self._last_display_text = display_text
 
-            # Resize to fit new content
-            self.adjustSize()
+        self.workspace_label.setText(display_text)
 
-            # Only reposition if user hasn't moved the window manually
-            if not self.user_moved:
-                self._position_window()
+        # Resize to fit new content
+        self._fit_to_label()
 
-            logger.debug(
-                f"Updated workspace indicator for monitor {self.monitor_id} "
-                f"to workspace {workspace_index}"
-            )
+        # Only reposition if user hasn't moved the window manually
+        if not self.user_moved:
+            self._position_window()
+
+        logger.debug(
+            f"Updated workspace indicator for monitor {self.monitor_id} "
+            f"to workspace {self.current_workspace}"
+        )
 
     def _get_workspace_color(self, workspace_index: int) -> str:
         """
@@ -336,8 +359,8 @@ class WorkspaceIndicator(QWidget):
 
         return colors[workspace_index % len(colors)]
 
-    def contextMenuEvent(self, event):
-        """Handle right-click context menu."""
+    def _build_context_menu(self) -> QMenu:
+        """Build the right-click context menu once; it is reused on every click."""
         menu = QMenu(self)
 
         # Add Reset Position option
@@ -345,14 +368,14 @@ class WorkspaceIndicator(QWidget):
         reset_action.triggered.connect(self.reset_position)
 
         # Add Refresh Monitors option
-        if self.window_manager:
-            refresh_action = menu.addAction("Refresh Monitors")
-            refresh_action.triggered.connect(self._refresh_monitors)
+        refresh_action = menu.addAction("Refresh Monitors")
+        refresh_action.triggered.connect(self._refresh_monitors)
+        refresh_action.setVisible(self.window_manager is not None)
 
         # Add Reload config option
-        if self.window_manager:
-            reload_action = menu.addAction("Reload config")
-            reload_action.triggered.connect(self._reload_config)
+        reload_action = menu.addAction("Reload config")
+        reload_action.triggered.connect(self._reload_config)
+        reload_action.setVisible(self.window_manager is not None)
 
         menu.addSeparator()
 
@@ -360,8 +383,12 @@ class WorkspaceIndicator(QWidget):
         quit_action = menu.addAction("Quit")
         quit_action.triggered.connect(self._quit_application)
 
+        return menu
+
+    def contextMenuEvent(self, event):
+        """Handle right-click context menu."""
         # Show the menu at the cursor position
-        menu.exec(event.globalPos())
+        self._context_menu.exec(event.globalPos())
 
     def _refresh_monitors(self):
         """Refresh monitor configuration."""
@@ -390,6 +417,7 @@ class WorkspaceIndicator(QWidget):
             opacity: New opacity (0.0 to 1.0)
         """
         self.template = template or self.DEFAULT_TEMPLATE
+        self._render = compile_template(self.template)
         self.show_layout = show_layout
         self.set_opacity(opacity)
         # Refresh label with current workspace state
@@ -400,6 +428,25 @@ class WorkspaceIndicator(QWidget):
             self.current_workspace_layout_flip,
         )
 
+    def update_monitor(self, monitor_info: MonitorInfo, display_monitor: int):
+        """
+        Move the indicator to updated monitor geometry.
+
+        Args:
+            monitor_info: New information for this indicator's monitor
+            display_monitor: Monitor number shown for {monitor} (1-based)
+        """
+        self.monitor_info = monitor_info
+        self._display_monitor = display_monitor
+        self.reset_position()
+        # Refresh label in case the displayed monitor number changed
+        self.update_workspace(
+            self.current_workspace,
+            self.current_workspace_name,
+            self.current_workspace_layout,
+            self.current_workspace_layout_flip,
+        )
+
     def _switch_to_workspace(self, workspace_index: int):
         """Switch to the specified workspace."""
         # This would integrate with komorebic to switch workspaces
@@ -425,9 +472,13 @@ class WorkspaceIndicator(QWidget):
         self.setWindowOpacity(opacity)
 
 
-class FloatingWindowManager:
+class FloatingWindowManager(QObject):
     """Manages floating workspace indicator windows for all monitors."""
 
+    # monitor_id, workspace_index, workspace_name, workspace_layout, workspace_layout_flip
+    # (monitor_id is an object: Komorebi IDs are HMONITOR values and may not fit a C int)
+    workspaceChanged = pyqtSignal(object, int, object, object, object)
+
     def __init__(
         self,
         monitor_manager,
@@ -437,6 +488,7 @@ class FloatingWindowManager:
         show_layout: bool = False,
         komorebi_client=None,
         opacity: Optional[float] = None,
+        render: Optional[TemplateRenderer] = None,
     ):
         """
         Initialize the floating window manager.
@@ -449,50 +501,78 @@ class FloatingWindowManager:
             show_layout: Whether to show workspace layout
             komorebi_client: KomorebiClient instance for workspace switching
             opacity: Window opacity (0.0 to 1.0), defaults to WorkspaceIndicator.DEFAULT_OPACITY if None
+            render: Precompiled renderer for template, shared by all indicators
         """
+        super().__init__()
         self.monitor_manager = monitor_manager
         self.indicators: Dict[int, WorkspaceIndicator] = (
             {}
         )  # key: monitor_id (Komorebi monitor ID)
+        self._indicator_hwnds: Set[int] = set()  # native handles of shown indicators
         self.template = template
         self.show_monitor = show_monitor
         self.show_name = show_name
         self.show_layout = show_layout
         self.komorebi_client = komorebi_client
         self.opacity = opacity
+        self.render = render
         self.app = None
 
+        # Queued so updates from any thread are applied on the GUI thread
+        self.workspaceChanged.connect(
+            self._apply_workspace_state, Qt.ConnectionType.QueuedConnection
+        )
+
         # Create indicators for all monitors
         self._create_indicators()
 
+    @staticmethod
+    def _display_monitor_number(monitor: MonitorInfo, position: int) -> int:
+        """Very large Komorebi IDs are shown by screen position instead (1-based)."""
+        return monitor.id if monitor.id <= 100 else position
+
+    def _create_indicator(self, monitor: MonitorInfo, position: int) -> WorkspaceIndicator:
+        """Create the workspace indicator for a single monitor."""
+        indicator = WorkspaceIndicator(
+            monitor,
+            monitor_id=monitor.id,  # Use actual Komorebi monitor ID
+            parent=None,
+            template=self.template,
+            show_monitor=self.show_monitor,
+            show_name=self.show_name,
+            show_layout=self.show_layout,
+            komorebi_client=self.komorebi_client,
+            window_manager=self,
+            opacity=self.opacity,
+            render=self.render,
+            display_monitor=self._display_monitor_number(monitor, position),
+        )
+        self.indicators[monitor.id] = indicator  # Use Komorebi monitor ID as key
+        logger.info(f"Created indicator for monitor {monitor.id}")
+        return indicator
+
     def _create_indicators(self):
         """Create workspace indicators for all monitors."""
-        # Sort monitors by their position to ensure consistent indexing
-        monitors = sorted(
-            self.monitor_manager.get_monitors(), key=lambda m: (m.rect[0], m.rect[1])
-        )  # Sort by x, then y
-
-        # Create indicators with actual Komorebi monitor IDs
-        for monitor in monitors:
-            indicator = WorkspaceIndicator(
-                monitor,
-                monitor_id=monitor.id,  # Use actual Komorebi monitor ID
-                parent=None,
-                template=self.template,
-                show_monitor=self.show_monitor,
-                show_name=self.show_name,
-                show_layout=self.show_layout,
-                komorebi_client=self.komorebi_client,
-                window_manager=self,
-                opacity=self.opacity,
-            )
-            self.indicators[monitor.id] = indicator  # Use Komorebi monitor ID as key
-            logger.info(f"Created indicator for monitor {monitor.id}")
+        # Monitors come pre-sorted by position to ensure consistent indexing
+        for position, monitor in enumerate(self.monitor_manager.sorted_monitors, start=1):
+            self._create_indicator(monitor, position)
 
     def show_all_indicators(self):
         """Show all workspace indicators."""
-        for indicator in self.indicators.values():
-            indicator.show()
+        # Called on every poll; only touch windows that are actually hidden
+        hidden = [ind for ind in self.indicators.values() if not ind.isVisible()]
+        if not hidden:
+            return
+        # Map every window first, then let them all paint in one pass
+        for indicator in hidden:
+            indicator.setUpdatesEnabled(False)
+        try:
+            for indicator in hidden:
+                indicator.show()
+                self._indicator_hwnds.add(int(indicator.winId()))
+        finally:
+            for indicator in hidden:
+                indicator.setUpdatesEnabled(True)
         logger.info(f"Showing {len(self.indicators)} workspace indicators")
 
     def initialize_all_indicators(self, workspace_index: int):
@@ -505,7 +585,10 @@ class FloatingWindowManager:
 
     def hide_all_indicators(self):
         """Hide all workspace indicators."""
-        for indicator in self.indicators.values():
+        visible = [ind for ind in self.indicators.values() if ind.isVisible()]
+        if not visible:
+            return
+        for indicator in visible:
             indicator.hide()
         logger.info("Hiding all workspace indicators")
 
@@ -513,19 +596,38 @@ class FloatingWindowManager:
         """
         Update workspace state for the appropriate monitor.
 
+        Safe to call from any thread; the indicator is updated from the
+        Qt event loop via the queued workspaceChanged signal.
+
         Args:
             workspace_state: Current workspace state
         """
         # Komorebi uses 1-based monitor indices
-        monitor_id = workspace_state.monitor_index
+        self.workspaceChanged.emit(
+            workspace_state.monitor_index,
+            workspace_state.workspace_index,
+            workspace_state.workspace_name,
+            workspace_state.workspace_layout,
+            getattr(workspace_state, "workspace_layout_flip", None),
+        )
+
+    def _apply_workspace_state(
+        self,
+        monitor_id: int,
+        workspace_index: int,
+        workspace_name: Optional[str],
+        workspace_layout: Optional[str],
+        workspace_layout_flip: Optional[str],
+    ):
+        """Forward a workspaceChanged signal to the monitor's indicator."""
         indicator = self.indicators.get(monitor_id)
 
         if indicator:
             indicator.update_workspace(
-                workspace_state.workspace_index,
-                workspace_state.workspace_name,
-                workspace_state.workspace_layout,
-                getattr(workspace_state, "workspace_layout_flip", None),
+                workspace_index,
+                workspace_name,
+                workspace_layout,
+                workspace_layout_flip,
             )
         else:
             logger.warning(f"No indicator found for monitor {monitor_id}")
@@ -536,20 +638,28 @@ class FloatingWindowManager:
         
         # First refresh the monitor manager to get updated monitor information
         self.monitor_manager.refresh()
-        
-        # Hide existing indicators
-        self.hide_all_indicators()
+        monitors = self.monitor_manager.sorted_monitors
+        new_ids = {monitor.id for monitor in monitors}
 
-        # Clear existing indicators
-        for indicator in self.indicators.values():
+        # Close indicators for monitors that went away
+        for monitor_id in set(self.indicators) - new_ids:
+            indicator = self.indicators.pop(monitor_id)
+            self._indicator_hwnds.discard(int(indicator.winId()))
             indicator.close()
-        self.indicators.clear()
-
-        # Create new indicators
-        self._create_indicators()
-
-        # Show new indicators
-        self.show_all_indicators()
+            logger.info(f"Removed indicator for monitor {monitor_id}")
+
+        for position, monitor in enumerate(monitors, start=1):
+            indicator = self.indicators.get(monitor.id)
+            if indicator is None:
+                # New monitor: create and show its indicator
+                indicator = self._create_indicator(monitor, position)
+                indicator.show()
+                self._indicator_hwnds.add(int(indicator.winId()))
+                continue
+            # Surviving monitor: update its geometry in place
+            indicator.update_monitor(
+                monitor, self._display_monitor_number(monitor, position)
+            )
 
         logger.info("Refreshed workspace indicators for new monitor configuration")
 
@@ -563,6 +673,7 @@ class FloatingWindowManager:
         self.show_name = settings.show_name
         self.show_layout = settings.show_layout
         self.opacity = settings.opacity
+        self.render = None  # Indicators recompile from the new template
 
         for indicator in self.indicators.values():
             indicator.apply_display_settings(
@@ -572,6 +683,18 @@ class FloatingWindowManager:
             )
         logger.info("Applied reloaded config to all indicators")
 
+    def is_own_hwnd(self, hwnd: int) -> bool:
+        """
+        Check if a native window handle belongs to one of our indicators.
+
+        Args:
+            hwnd: Native window handle (e.g. from GetForegroundWindow)
+
+        Returns:
+            True if hwnd is an indicator window, False otherwise
+        """
+        return hwnd in self._indicator_hwnds
+
     def get_indicator_count(self) -> int:
         """
         Get the number of active indicators.
@@ -5,12 +5,27 @@ Handles communication with the komorebic command line tool to query
 workspace and monitor state information.
 """
 
+import ctypes
+import importlib.util
 import json
 import logging
+import os
+import shutil
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Prefer orjson (parses UTF-8 bytes in C) and fall back to the stdlib
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +35,32 @@ if sys.platform == "win32":
 else:
     CREATE_NO_WINDOW = 0
 
+# Win32 error codes seen on the subscription pipe
+ERROR_BROKEN_PIPE = 109
+ERROR_PIPE_CONNECTED = 535
+ERROR_OPERATION_ABORTED = 995
+
+# Access right CancelSynchronousIo needs on the target thread
+THREAD_TERMINATE = 0x0001
+
+# Queries that make up a WorkspaceState when ``komorebic state`` is unavailable;
+# they are independent, so they are issued concurrently
+FALLBACK_QUERIES = (
+    "focused-monitor-index",
+    "focused-workspace-index",
+    "focused-workspace-name",
+    "focused-workspace-layout",
+)
+
+# Notification types after which the cached monitor list must be rebuilt
+MONITOR_TOPOLOGY_EVENTS = frozenset({
+    "DisplayConnectionChange",
+    "ResolutionScalingChanged",
+    "WorkAreaChanged",
+})
+
 
-@dataclass
+@dataclass(frozen=True)
 class KomorebiMonitorInfo:
     """Information about a monitor from Komorebi."""
 
@@ -29,10 +68,10 @@ class KomorebiMonitorInfo:
     name: str
     device: str
     device_id: str
-    size: Dict[str, int]  # left, top, right, bottom
+    size: Tuple[int, int, int, int]  # (left, top, right, bottom)
 
 
-@dataclass
+@dataclass(frozen=True)
 class WorkspaceState:
     """Represents the current workspace state for a monitor."""
 
@@ -43,18 +82,285 @@ class WorkspaceState:
     workspace_layout_flip: Optional[str] = None  # Horizontal, Vertical, or HorizontalAndVertical
 
 
+def _has_any(container: Optional[dict]) -> bool:
+    """Check whether a komorebi ``{"elements": [...]}`` ring holds any element."""
+    return bool(container) and bool(container.get("elements"))
+
+
+def _has_windows(workspace: dict) -> bool:
+    """Check whether a workspace from the state JSON holds any window."""
+    return (
+        _has_any(workspace.get("containers"))
+        or _has_any(workspace.get("floating_windows"))
+        or workspace.get("maximized_window") is not None
+    )
+
+
+def _workspaces_with_windows_from_state(state_data: dict, monitor_index: int) -> List[int]:
+    """
+    List the workspaces that have windows on a monitor of a parsed state.
+
+    Args:
+        state_data: Parsed ``komorebic state`` output
+        monitor_index: The monitor index (0-based, in komorebi's order)
+
+    Returns:
+        List of workspace indices (0-based) that have windows, or every
+        workspace index if none has windows
+    """
+    # Find the monitor by index
+    monitors = state_data.get("monitors", {}).get("elements", [])
+    if monitor_index >= len(monitors):
+        logger.warning(
+            f"Monitor index {monitor_index} not found in state (total monitors: {len(monitors)})"
+        )
+        return []
+
+    monitor = monitors[monitor_index]
+    workspaces = monitor.get("workspaces", {}).get("elements", [])
+
+    logger.debug("Found %d workspaces on monitor %s", len(workspaces), monitor_index)
+
+    workspaces_with_windows = []
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+
+    # Check each workspace for windows
+    for workspace_index, workspace in enumerate(workspaces):
+        # Check if workspace has any windows
+        has_windows = _has_windows(workspace)
+
+        if debug_enabled:
+            # Counts are only computed for the debug log
+            logger.debug(
+                "Workspace %d: containers=%d, floating=%d, maximized=%s, has_windows=%s",
+                workspace_index,
+                len(workspace.get("containers", {}).get("elements", [])),
+                len(workspace.get("floating_windows", {}).get("elements", [])),
+                workspace.get("maximized_window") is not None,
+                has_windows,
+            )
+
+        if has_windows:
+            workspaces_with_windows.append(workspace_index)
+
+    logger.debug(
+        "Found %d workspaces with windows on monitor %s: %s",
+        len(workspaces_with_windows), monitor_index, workspaces_with_windows,
+    )
+
+    # If no workspaces with windows found, but we know there should be some,
+    # return all workspaces as a fallback (this allows cycling through all workspaces)
+    if not workspaces_with_windows and workspaces:
+        logger.info(
+            "No workspaces with windows detected on monitor %s, falling back to all %d workspaces",
+            monitor_index, len(workspaces),
+        )
+        return list(range(len(workspaces)))
+
+    return workspaces_with_windows
+
+
 class KomorebiClient:
     """Client for interacting with the komorebic command line tool."""
 
-    def __init__(self, komorebic_path: str = "komorebic.exe"):
+    STATE_TTL = 0.1  # Seconds a fetched state is shared between callers
+    RUNNING_TTL = 2.0  # Seconds an is_komorebi_running() probe result is reused
+    SUBSCRIBE_RETRY_SECONDS = 2.0  # Delay before re-subscribing after the pipe drops
+    PIPE_BUFFER_SIZE = 64 * 1024
+    CLOSE_TIMEOUT_SECONDS = 1.0  # How long close() waits for the reader thread to exit
+
+    def __init__(self, komorebic_path: str = "komorebic.exe", subscribe: bool = True):
         """
         Initialize the Komorebi client.
 
         Args:
-            komorebic_path: Path to the komorebic executable
+            komorebic_path: Path to the komorebic executable (resolved on PATH once)
+            subscribe: Receive state pushes over ``komorebic subscribe-pipe``
+                       instead of spawning komorebic for every read (Windows only)
         """
-        self.komorebic_path = komorebic_path
+        # Absolute path lets CreateProcess skip the PATH search on every spawn
+        self.komorebic_path = shutil.which(komorebic_path) or komorebic_path
         self._cached_state: Optional[WorkspaceState] = None
+        self._state_cache: Optional[Tuple[float, dict]] = None  # (monotonic time, state)
+        self._state_ttl = self.STATE_TTL
+        self._running_cache: Optional[Tuple[float, bool]] = None  # (monotonic time, running)
+
+        # Monitor topology cache, rebuilt by get_monitor_information() after invalidate_monitors()
+        self._monitors_cache: Optional[List[KomorebiMonitorInfo]] = None
+        self._monitor_ids: List[int] = []  # monitor IDs in komorebi's order (index -> ID)
+        self._id_to_index: Dict[int, int] = {}  # monitor ID -> index in komorebi's monitor list
+        # invalidate_monitors() may run on the reader thread while the GUI thread rebuilds
+        # the cache; the rebuild only stores its result if no invalidation happened meanwhile
+        self._monitors_lock = threading.Lock()
+        self._monitors_generation = 0
+
+        # Subscription state, written by the reader thread; only it touches the pipe handle
+        self.pipe_name = f"komorebi-indicator-{os.getpid()}"
+        self._pipe_handle = None
+        self._subscribed = False  # True while the pipe is delivering state
+        self._pushed_state: Optional[dict] = None  # Latest state pushed by komorebi
+        self._dirty = False  # Set on every pushed event, cleared by has_workspace_changed
+        self._closed = threading.Event()
+        self._reader_thread: Optional[threading.Thread] = None
+        # Called from the reader thread after each pushed state; must be thread-safe
+        self.on_state_pushed: Optional[Callable[[], None]] = None
+
+        # Created on first use by the query fallback
+        self._pool: Optional[ThreadPoolExecutor] = None
+        if subscribe and sys.platform == "win32":
+            self._start_subscription()
+
+    def _start_subscription(self):
+        """Start the background thread that reads komorebi's subscription pipe."""
+        if importlib.util.find_spec("win32pipe") is None:
+            logger.info("pywin32 not available, polling komorebic instead of subscribing")
+            return
+        self._reader_thread = threading.Thread(
+            target=self._subscription_loop, name="komorebi-subscribe", daemon=True
+        )
+        self._reader_thread.start()
+
+    def _subscription_loop(self):
+        """Keep a subscription pipe open, re-subscribing if komorebi drops it."""
+        while not self._closed.is_set():
+            try:
+                self._read_subscription()
+            except Exception as e:
+                # close() aborts pending pipe I/O; that is not worth a warning
+                if not self._closed.is_set():
+                    logger.warning(f"komorebi subscription pipe closed: {e}")
+            finally:
+                self._subscribed = False
+                self._pushed_state = None
+                self._close_pipe()
+            # Readers fall back to polling komorebic until the pipe is back
+            self._closed.wait(self.SUBSCRIBE_RETRY_SECONDS)
+
+    def _read_subscription(self):
+        """Create the named pipe, subscribe komorebi to it, and read events until it breaks."""
+        import pywintypes
+        import win32file
+        import win32pipe
+
+        self._pipe_handle = win32pipe.CreateNamedPipe(
+            rf"\\.\pipe\{self.pipe_name}",
+            win32pipe.PIPE_ACCESS_DUPLEX,
+            win32pipe.PIPE_TYPE_BYTE | win32pipe.PIPE_READMODE_BYTE | win32pipe.PIPE_WAIT,
+            1,
+            self.PIPE_BUFFER_SIZE,
+            self.PIPE_BUFFER_SIZE,
+            0,
+            None,
+        )
+
+        result = subprocess.run(
+            [self.komorebic_path, "subscribe-pipe", self.pipe_name],
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            timeout=5.0,
+            creationflags=CREATE_NO_WINDOW,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"komorebic subscribe-pipe failed: {result.stderr}")
+
+        try:
+            win32pipe.ConnectNamedPipe(self._pipe_handle, None)
+        except pywintypes.error as e:
+            if e.winerror != ERROR_PIPE_CONNECTED:
+                raise
+        logger.info(f"Subscribed to komorebi notifications on pipe {self.pipe_name}")
+
+        buffer = b""
+        while not self._closed.is_set():
+            try:
+                _, data = win32file.ReadFile(self._pipe_handle, self.PIPE_BUFFER_SIZE)
+            except pywintypes.error as e:
+                if e.winerror == ERROR_BROKEN_PIPE:
+                    return
+                raise
+            buffer += data
+            # Notifications are newline-delimited JSON objects
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                if line.strip():
+                    self._handle_notification(line)
+
+    def _handle_notification(self, line: bytes):
+        """Store the state carried by one subscription notification."""
+        try:
+            notification = json_loads(line)
+        except json.JSONDecodeError as e:
+            logger.warning(f"Ignoring malformed komorebi notification: {e}")
+            return
+        state_data = notification.get("state")
+        event = notification.get("event")
+        has_state = isinstance(state_data, dict)
+        # Publish the new state before invalidating, so a rebuild never re-reads the old one
+        if has_state:
+            self._pushed_state = state_data
+        if isinstance(event, dict) and event.get("type") in MONITOR_TOPOLOGY_EVENTS:
+            self.invalidate_monitors()
+        if has_state:
+            if self._monitors_cache is not None:
+                # A monitor appeared or vanished without a topology event
+                elements = state_data.get("monitors", {}).get("elements", [])
+                if [monitor_data.get("id") for monitor_data in elements] != self._monitor_ids:
+                    self.invalidate_monitors()
+            self._subscribed = True
+            self._dirty = True
+            callback = self.on_state_pushed
+            if callback is not None:
+                callback()
+
+    def _close_pipe(self):
+        """Close the subscription pipe handle, if open. Called only from the reader thread."""
+        handle, self._pipe_handle = self._pipe_handle, None
+        if handle is not None:
+            try:
+                import win32file
+                win32file.CloseHandle(handle)
+            except Exception:
+                pass
+
+    def _cancel_reader_io(self, thread: threading.Thread):
+        """Abort the blocking ConnectNamedPipe/ReadFile the reader thread may be waiting in."""
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenThread(THREAD_TERMINATE, False, thread.native_id)
+        if not handle:
+            return
+        try:
+            kernel32.CancelSynchronousIo(handle)
+        finally:
+            kernel32.CloseHandle(handle)
+
+    def close(self):
+        """Stop the subscription reader thread, release the pipe and the query pool."""
+        self._closed.set()
+        thread, self._reader_thread = self._reader_thread, None
+        if thread is not None and thread.is_alive():
+            # Closing the handle from here would not abort the reader's synchronous I/O,
+            # so cancel it and let the reader close the pipe on its way out. Cancel
+            # repeatedly: the reader may not have entered the blocking call yet.
+            deadline = time.monotonic() + self.CLOSE_TIMEOUT_SECONDS
+            while thread.is_alive() and time.monotonic() < deadline:
+                self._cancel_reader_io(thread)
+                thread.join(0.05)
+            if thread.is_alive():
+                logger.warning("komorebi subscription reader did not stop in time")
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def is_subscribed(self) -> bool:
+        """
+        Check if komorebi is currently pushing state over the subscription pipe.
+
+        Returns:
+            True while pushed state is available, False when readers poll komorebic
+        """
+        return self._subscribed
 
     def is_komorebi_running(self) -> bool:
         """
@@ -63,12 +369,142 @@ class KomorebiClient:
         Returns:
             True if komorebic is accessible, False otherwise
         """
+        if self._subscribed:
+            # Komorebi is pushing state to us, so it is running
+            return True
+        now = time.monotonic()
+        if self._running_cache is not None and now - self._running_cache[0] < self.RUNNING_TTL:
+            return self._running_cache[1]
         try:
             result = self._execute_query("version")
-            return result is not None and result.strip() != ""
+            running = bool(result)  # _execute_query already strips the output
         except Exception as e:
             logger.warning(f"Failed to check if Komorebi is running: {e}")
-            return False
+            running = False
+        self._running_cache = (now, running)
+        return running
+
+    def _fetch_state_json(self) -> Optional[dict]:
+        """
+        Run ``komorebic state`` once and parse the result.
+
+        Returns:
+            Parsed state dict or None if the command or parsing fails
+        """
+        try:
+            # Raw bytes: the JSON parser decodes UTF-8 itself, no separate text pass
+            result = subprocess.run(
+                [self.komorebic_path, "state"],
+                capture_output=True,
+                timeout=5.0,
+                creationflags=CREATE_NO_WINDOW if sys.platform == "win32" else 0,
+            )
+
+            if result.returncode != 0:
+                stderr = result.stderr.decode("utf-8", errors="replace")
+                logger.error(f"Failed to get komorebi state: {stderr}")
+                return None
+
+            return json_loads(result.stdout)
+
+        except subprocess.TimeoutExpired:
+            logger.error("komorebic state timed out")
+            return None
+        except FileNotFoundError:
+            logger.error(f"komorebic executable not found at: {self.komorebic_path}")
+            return None
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse komorebi state JSON: {e}")
+            self.invalidate_monitors()
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error executing komorebic state: {e}")
+            return None
+
+    def _get_state_cached(self, force: bool = False) -> Optional[dict]:
+        """
+        Get the parsed komorebic state, reusing a fetch younger than the TTL.
+
+        Args:
+            force: Ignore the cache and fetch fresh state
+
+        Returns:
+            Parsed state dict or None if the fetch fails
+        """
+        if not force and self._subscribed and self._pushed_state is not None:
+            # Komorebi pushes every change over the pipe; no need to spawn komorebic
+            return self._pushed_state
+
+        now = time.monotonic()
+        if not force and self._state_cache is not None:
+            fetched_at, state_data = self._state_cache
+            if now - fetched_at < self._state_ttl:
+                return state_data
+
+        state_data = self._fetch_state_json()
+        # Failures are not cached so the next caller retries
+        self._state_cache = (now, state_data) if state_data is not None else None
+        return state_data
+
+    def invalidate_state_cache(self):
+        """Drop the cached state so the next read fetches fresh data."""
+        self._state_cache = None
+
+    @staticmethod
+    def _focused_workspace_details(monitor_data: dict):
+        """
+        Extract the focused workspace of a monitor from its state JSON.
+
+        Args:
+            monitor_data: One element of state["monitors"]["elements"]
+
+        Returns:
+            Tuple of (workspace_index, workspace_name, workspace_layout, workspace_layout_flip)
+        """
+        workspaces = monitor_data.get("workspaces", {})
+        focused_workspace = workspaces.get("focused", 0)
+        workspace_elements = workspaces.get("elements", [])
+
+        # Get workspace layout and layout_flip for the focused workspace from state
+        workspace_layout = None
+        workspace_layout_flip = None
+        element_name = None
+        if focused_workspace < len(workspace_elements):
+            ws_el = workspace_elements[focused_workspace]
+            layout_node = ws_el.get("layout")
+            if isinstance(layout_node, dict):
+                # Prefer "Default" key (e.g. "VerticalStack"), else first value
+                workspace_layout = layout_node.get("Default")
+                if workspace_layout is None and layout_node:
+                    workspace_layout = next(iter(layout_node.values()), None)
+            workspace_layout_flip = ws_el.get("layout_flip")
+            element_name = ws_el.get("name")
+
+        # Get workspace name if available
+        workspace_names = monitor_data.get("workspace_names", {})
+        workspace_name = workspace_names.get(str(focused_workspace)) or element_name
+
+        return focused_workspace, workspace_name, workspace_layout, workspace_layout_flip
+
+    def _focused_monitor_data(self, state_data: Optional[dict]) -> Optional[dict]:
+        """
+        Get the focused monitor's element from a state dict.
+
+        Args:
+            state_data: Parsed ``komorebic state`` output
+
+        Returns:
+            Monitor dict or None if unavailable
+        """
+        if not state_data:
+            return None
+        monitors = state_data.get("monitors", {})
+        monitors_data = monitors.get("elements", [])
+        monitor_index = monitors.get("focused", 0)
+        if monitor_index >= len(monitors_data):
+            logger.error(f"Monitor index {monitor_index} out of range")
+            return None
+        return monitors_data[monitor_index]
 
     def get_focused_monitor_index(self) -> Optional[int]:
         """
@@ -77,13 +513,10 @@ class KomorebiClient:
         Returns:
             Monitor index (0-based) or None if query fails
         """
-        try:
-            result = self._execute_query("focused-monitor-index")
-            if result:
-                return int(result.strip())
-        except (ValueError, subprocess.SubprocessError) as e:
-            logger.error(f"Failed to get focused monitor index: {e}")
-        return None
+        state_data = self._get_state_cached()
+        if state_data is None:
+            return None
+        return state_data.get("monitors", {}).get("focused")
 
     def get_focused_workspace_index(self) -> Optional[int]:
         """
@@ -92,13 +525,10 @@ class KomorebiClient:
         Returns:
             Workspace index (0-based) or None if query fails
         """
-        try:
-            result = self._execute_query("focused-workspace-index")
-            if result:
-                return int(result.strip())
-        except (ValueError, subprocess.SubprocessError) as e:
-            logger.error(f"Failed to get focused workspace index: {e}")
-        return None
+        monitor_data = self._focused_monitor_data(self._get_state_cached())
+        if monitor_data is None:
+            return None
+        return self._focused_workspace_details(monitor_data)[0]
 
     def get_focused_workspace_name(self) -> Optional[str]:
         """
@@ -107,13 +537,10 @@ class KomorebiClient:
         Returns:
             Workspace name or None if not set or query fails
         """
-        try:
-            result = self._execute_query("focused-workspace-name")
-            if result and result.strip():
-                return result.strip()
-        except subprocess.SubprocessError as e:
-            logger.error(f"Failed to get focused workspace name: {e}")
-        return None
+        monitor_data = self._focused_monitor_data(self._get_state_cached())
+        if monitor_data is None:
+            return None
+        return self._focused_workspace_details(monitor_data)[1] or None
 
     def get_focused_workspace_layout(self) -> Optional[str]:
         """
@@ -122,13 +549,10 @@ class KomorebiClient:
         Returns:
             Workspace layout or None if query fails
         """
-        try:
-            result = self._execute_query("focused-workspace-layout")
-            if result and result.strip():
-                return result.strip()
-        except subprocess.SubprocessError as e:
-            logger.error(f"Failed to get focused workspace layout: {e}")
-        return None
+        monitor_data = self._focused_monitor_data(self._get_state_cached())
+        if monitor_data is None:
+            return None
+        return self._focused_workspace_details(monitor_data)[2]
 
     def get_current_workspace_state(self) -> Optional[WorkspaceState]:
         """
@@ -137,62 +561,105 @@ class KomorebiClient:
         Returns:
             WorkspaceState object or None if any query fails
         """
-        try:
-            monitor_index = self.get_focused_monitor_index()
-            workspace_index = self.get_focused_workspace_index()
+        return self._read_current_state()
 
-            if monitor_index is None or workspace_index is None:
-                return None
-
-            # Get the original unfiltered monitor list to map index to ID correctly
-            result = self._execute_monitor_info_command()
-            if not result:
-                return None
-
-            monitors_data = json.loads(result)
-            if monitor_index >= len(monitors_data):
-                logger.error(f"Monitor index {monitor_index} out of range")
-                return None
+    def _read_current_state(self) -> Optional[WorkspaceState]:
+        """
+        Read the focused workspace state without touching the comparison cache.
 
-            monitor_id = monitors_data[monitor_index]["id"]
+        Returns:
+            WorkspaceState object or None if any query fails
+        """
+        try:
+            # One komorebic call provides every field of the focused workspace
+            monitor_data = self._focused_monitor_data(self._get_state_cached())
+            if monitor_data is None:
+                return self._query_current_workspace_state()
 
-            workspace_name = self.get_focused_workspace_name()
-            workspace_layout = self.get_focused_workspace_layout()
+            workspace_index, workspace_name, workspace_layout, workspace_layout_flip = (
+                self._focused_workspace_details(monitor_data)
+            )
 
-            state = WorkspaceState(
-                monitor_index=monitor_id,  # Store actual monitor ID, not 0-based index
+            return WorkspaceState(
+                monitor_index=monitor_data["id"],  # Store actual monitor ID, not 0-based index
                 workspace_index=workspace_index,
                 workspace_name=workspace_name,
                 workspace_layout=workspace_layout,
-                workspace_layout_flip=None,  # Not available from single-monitor query
+                workspace_layout_flip=workspace_layout_flip,
             )
 
-            # Cache the state for comparison
-            self._cached_state = state
-            return state
-
         except Exception as e:
             logger.error(f"Failed to get current workspace state: {e}")
             return None
 
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for concurrent fallback queries."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=len(FALLBACK_QUERIES) + 1, thread_name_prefix="komorebic"
+            )
+        return self._pool
+
+    def _query_current_workspace_state(self) -> Optional[WorkspaceState]:
+        """
+        Build the current workspace state from individual komorebic queries.
+
+        Used when ``komorebic state`` is unavailable. The queries are
+        independent, so they are spawned concurrently.
+
+        Returns:
+            WorkspaceState object or None if any required query fails
+        """
+        pool = self._get_pool()
+        futures = {query: pool.submit(self._execute_query, query) for query in FALLBACK_QUERIES}
+        monitors_future = pool.submit(self._execute_command, ["monitor-information"])
+        results = {query: future.result() for query, future in futures.items()}
+        monitors_output = monitors_future.result()
+
+        try:
+            monitor_index = int(results["focused-monitor-index"])
+            workspace_index = int(results["focused-workspace-index"])
+            monitors_data = json_loads(monitors_output)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to query current workspace state: {e}")
+            return None
+
+        if monitor_index >= len(monitors_data):
+            logger.error(f"Monitor index {monitor_index} out of range")
+            return None
+
+        return WorkspaceState(
+            monitor_index=monitors_data[monitor_index]["id"],  # Store actual monitor ID
+            workspace_index=workspace_index,
+            workspace_name=results["focused-workspace-name"] or None,
+            workspace_layout=results["focused-workspace-layout"] or None,
+            workspace_layout_flip=None,  # Not available from single-monitor queries
+        )
+
     def has_workspace_changed(self) -> bool:
         """
         Check if the workspace state has changed since last query.
 
+        Any difference counts, including the workspace name, layout or flip.
+
         Returns:
             True if workspace state has changed, False otherwise
         """
-        current_state = self.get_current_workspace_state()
+        if self._subscribed:
+            # Nothing was pushed since the last check: no need to look at state
+            if not self._dirty:
+                return False
+            self._dirty = False
+
+        current_state = self._read_current_state()
         if current_state is None:
             return False
 
-        if self._cached_state is None:
+        # The cache only moves when the state actually changed
+        if current_state != self._cached_state:
+            self._cached_state = current_state
             return True
-
-        return (
-            current_state.monitor_index != self._cached_state.monitor_index
-            or current_state.workspace_index != self._cached_state.workspace_index
-        )
+        return False
 
     def _execute_query(self, query_type: str) -> Optional[str]:
         """
@@ -202,11 +669,24 @@ class KomorebiClient:
             query_type: The type of query to execute
 
         Returns:
-            Query result as string or None if failed
+            Query result as a stripped string or None if failed
         """
+        return self._execute_command(["query", query_type])
+
+    def _execute_command(self, args: List[str]) -> Optional[str]:
+        """
+        Execute a komorebic command and return its output.
+
+        Args:
+            args: komorebic arguments, e.g. ["query", "focused-monitor-index"]
+
+        Returns:
+            Command output as a stripped string or None if failed
+        """
+        command = " ".join(args)
         try:
             result = subprocess.run(
-                [self.komorebic_path, "query", query_type],
+                [self.komorebic_path, *args],
                 capture_output=True,
                 text=True,
                 encoding="utf-8",
@@ -218,99 +698,102 @@ class KomorebiClient:
             if result.returncode == 0:
                 return result.stdout.strip()
             else:
-                logger.error(f"komorebic query failed: {result.stderr}")
+                logger.error(f"komorebic {command} failed: {result.stderr}")
                 return None
 
         except subprocess.TimeoutExpired:
-            logger.error(f"komorebic query timed out for: {query_type}")
+            logger.error(f"komorebic {command} timed out")
             return None
         except FileNotFoundError:
             logger.error(f"komorebic executable not found at: {self.komorebic_path}")
             return None
         except Exception as e:
-            logger.error(f"Unexpected error executing komorebic query: {e}")
+            logger.error(f"Unexpected error executing komorebic {command}: {e}")
             return None
 
+    def invalidate_monitors(self):
+        """Forget the cached monitor list so the next lookup re-reads komorebi."""
+        with self._monitors_lock:
+            self._monitors_generation += 1
+            self._monitors_cache = None
+            self._monitor_ids = []
+            self._id_to_index = {}
+
     def get_monitor_information(self) -> List[KomorebiMonitorInfo]:
         """
         Get monitor information from Komorebi.
 
+        The list is cached until invalidate_monitors() is called (monitor
+        topology changes rarely).
+
         Returns:
             List of KomorebiMonitorInfo objects, excluding UNKNOWN entries
         """
+        cached = self._monitors_cache
+        if cached is not None:
+            return list(cached)
+
+        generation = self._monitors_generation
         try:
-            result = self._execute_monitor_info_command()
-            if not result:
+            state_data = self._get_state_cached()
+            if state_data is None:
                 return []
 
-            # Parse JSON response
-            monitors_data = json.loads(result)
+            monitors_data = state_data.get("monitors", {}).get("elements", [])
             monitors = []
+            # Both lookup structures come from the same pass over komorebi's list
+            monitor_ids = [monitor_data["id"] for monitor_data in monitors_data]
 
             for i, monitor_data in enumerate(monitors_data):
                 # Skip UNKNOWN monitors
                 if monitor_data.get("device") == "UNKNOWN":
-                    logger.info(f"Skipping UNKNOWN monitor {i}")
+                    logger.info("Skipping UNKNOWN monitor %d", i)
                     continue
 
+                size = monitor_data["size"]
+                left, top, right, bottom = size["left"], size["top"], size["right"], size["bottom"]
                 monitor_info = KomorebiMonitorInfo(
                     id=monitor_data["id"],
                     name=monitor_data["name"],
                     device=monitor_data["device"],
                     device_id=monitor_data["device_id"],
-                    size=monitor_data["size"],
+                    size=(left, top, right, bottom),
                 )
                 monitors.append(monitor_info)
                 logger.info(
-                    f"Found Komorebi monitor {i}: {monitor_info.name} "
-                    f"({monitor_info.size['right'] - monitor_info.size['left']}x"
-                    f"{monitor_info.size['bottom'] - monitor_info.size['top']})"
+                    "Found Komorebi monitor %d: %s (%dx%d)",
+                    i, monitor_info.name, right - left, bottom - top,
                 )
 
-            return monitors
+            with self._monitors_lock:
+                # A topology change landed while building: leave the cache empty for a re-read
+                if self._monitors_generation == generation:
+                    self._monitors_cache = monitors
+                    self._monitor_ids = monitor_ids
+                    self._id_to_index = {monitor_id: i for i, monitor_id in enumerate(monitor_ids)}
+            return list(monitors)
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse monitor information JSON: {e}")
-            return []
         except Exception as e:
             logger.error(f"Failed to get monitor information: {e}")
             return []
 
-    def _execute_monitor_info_command(self) -> Optional[str]:
+    def _monitor_data_at(self, monitor_index: int) -> Optional[dict]:
         """
-        Execute the komorebic monitor-information command.
+        Get a monitor's element from the (cached) state by 0-based index.
+
+        Args:
+            monitor_index: The monitor index
 
         Returns:
-            Command result as string or None if failed
+            Monitor dict, or None if the state is unavailable or index is out of range
         """
-        try:
-            result = subprocess.run(
-                [self.komorebic_path, "monitor-information"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=5.0,  # 5 second timeout
-                creationflags=CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-            )
-
-            if result.returncode == 0:
-                return result.stdout.strip()
-            else:
-                logger.error(f"komorebic monitor-information failed: {result.stderr}")
-                return None
-
-        except subprocess.TimeoutExpired:
-            logger.error("komorebic monitor-information timed out")
+        state_data = self._get_state_cached()
+        if state_data is None:
             return None
-        except FileNotFoundError:
-            logger.error(f"komorebic executable not found at: {self.komorebic_path}")
-            return None
-        except Exception as e:
-            logger.error(
-                f"Unexpected error executing komorebic monitor-information: {e}"
-            )
+        monitors = state_data.get("monitors", {}).get("elements", [])
+        if not 0 <= monitor_index < len(monitors):
             return None
+        return monitors[monitor_index]
 
     def get_workspace_index_for_monitor(self, monitor_index: int) -> Optional[int]:
         """
@@ -322,10 +805,15 @@ class KomorebiClient:
         Returns:
             Workspace index (0-based) or None if query fails
         """
+        monitor_data = self._monitor_data_at(monitor_index)
+        if monitor_data is not None:
+            return monitor_data.get("workspaces", {}).get("focused", 0)
+
+        # State unavailable: fall back to a dedicated query
         try:
             result = self._execute_query(f"workspace-index {monitor_index}")
             if result:
-                return int(result.strip())
+                return int(result)
         except (ValueError, subprocess.SubprocessError) as e:
             logger.error(
                 f"Failed to get workspace index for monitor {monitor_index}: {e}"
@@ -342,10 +830,15 @@ class KomorebiClient:
         Returns:
             Workspace name or None if not set or query fails
         """
+        monitor_data = self._monitor_data_at(monitor_index)
+        if monitor_data is not None:
+            return self._focused_workspace_details(monitor_data)[1] or None
+
+        # State unavailable: fall back to a dedicated query
         try:
             result = self._execute_query(f"workspace-name {monitor_index}")
-            if result and result.strip():
-                return result.strip()
+            if result:
+                return result
         except subprocess.SubprocessError as e:
             logger.error(
                 f"Failed to get workspace name for monitor {monitor_index}: {e}"
@@ -361,22 +854,10 @@ class KomorebiClient:
         """
         try:
             # Get the current state from komorebic
-            result = subprocess.run(
-                [self.komorebic_path, "state"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=5.0,
-                creationflags=CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-            )
-
-            if result.returncode != 0:
-                logger.error(f"Failed to get komorebi state: {result.stderr}")
+            state_data = self._get_state_cached()
+            if state_data is None:
                 return []
 
-            # Parse JSON state
-            state_data = json.loads(result.stdout)
             monitors_data = state_data.get("monitors", {}).get("elements", [])
 
             states = []
@@ -384,30 +865,13 @@ class KomorebiClient:
             for monitor_index, monitor_data in enumerate(monitors_data):
                 # Skip UNKNOWN monitors
                 if monitor_data.get("device") == "UNKNOWN":
-                    logger.info(f"Skipping UNKNOWN monitor {monitor_index}")
+                    logger.info("Skipping UNKNOWN monitor %d", monitor_index)
                     continue
 
                 monitor_id = monitor_data["id"]
-                workspaces = monitor_data.get("workspaces", {})
-                focused_workspace = workspaces.get("focused", 0)
-                workspace_elements = workspaces.get("elements", [])
-
-                # Get workspace layout and layout_flip for the focused workspace from state
-                workspace_layout = None
-                workspace_layout_flip = None
-                if focused_workspace < len(workspace_elements):
-                    ws_el = workspace_elements[focused_workspace]
-                    layout_node = ws_el.get("layout")
-                    if isinstance(layout_node, dict):
-                        # Prefer "Default" key (e.g. "VerticalStack"), else first value
-                        workspace_layout = layout_node.get("Default")
-                        if workspace_layout is None and layout_node:
-                            workspace_layout = next(iter(layout_node.values()), None)
-                    workspace_layout_flip = ws_el.get("layout_flip")
-
-                # Get workspace name if available
-                workspace_names = monitor_data.get("workspace_names", {})
-                workspace_name = workspace_names.get(str(focused_workspace))
+                focused_workspace, workspace_name, workspace_layout, workspace_layout_flip = (
+                    self._focused_workspace_details(monitor_data)
+                )
 
                 state = WorkspaceState(
                     monitor_index=monitor_id,  # Store actual monitor ID
@@ -419,14 +883,11 @@ class KomorebiClient:
                 states.append(state)
 
                 logger.info(
-                    f"Found monitor {monitor_id} on workspace {focused_workspace}"
+                    "Found monitor %s on workspace %s", monitor_id, focused_workspace
                 )
 
             return states
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse komorebi state JSON: {e}")
-            return []
         except Exception as e:
             logger.error(f"Failed to get all monitors workspace state: {e}")
             return []
@@ -442,116 +903,70 @@ class KomorebiClient:
             0-based monitor index or None if not found
         """
         try:
-            monitors = self.get_monitor_information()
-            for i, monitor in enumerate(monitors):
-                if monitor.id == monitor_id:
-                    return i
-            return None
+            index = self._id_to_index.get(monitor_id)
+            if index is None:
+                # First lookup, or a monitor we have not seen yet: rebuild the map once
+                self.invalidate_monitors()
+                self.get_monitor_information()
+                index = self._id_to_index.get(monitor_id)
+            return index
         except Exception as e:
             logger.error(f"Failed to get monitor index from ID {monitor_id}: {e}")
             return None
 
+    def _resolve_monitor_index(self, monitor_identifier: int, is_id: bool) -> Optional[int]:
+        """
+        Turn a monitor index or Komorebi monitor ID into a 0-based monitor index.
+
+        Args:
+            monitor_identifier: The monitor index (0-based) or Komorebi monitor ID
+            is_id: True if monitor_identifier is a Komorebi monitor ID
+
+        Returns:
+            0-based monitor index or None if the ID is unknown
+        """
+        if is_id:
+            return self.get_monitor_index_from_id(monitor_identifier)
+        return monitor_identifier
+
     def get_workspaces_with_windows_for_monitor(
-        self, monitor_identifier: int
+        self,
+        monitor_identifier: int,
+        *,
+        is_id: bool = False,
+        state_data: Optional[dict] = None,
     ) -> List[int]:
         """
         Get list of workspace indices that have windows on the specified monitor.
 
         Args:
             monitor_identifier: The monitor index (0-based) or Komorebi monitor ID
+            is_id: True if monitor_identifier is a Komorebi monitor ID
+            state_data: Already-parsed komorebic state to reuse; read from the
+                        state cache if None
 
         Returns:
             List of workspace indices (0-based) that have windows
         """
         try:
-            # Determine if this is a monitor ID or index
-            # If it's a large number, it's likely a monitor ID
-            if monitor_identifier > 1000:  # Monitor IDs are typically large numbers
-                monitor_index = self.get_monitor_index_from_id(monitor_identifier)
-                if monitor_index is None:
-                    logger.warning(f"Monitor ID {monitor_identifier} not found")
-                    return []
-            else:
-                monitor_index = monitor_identifier
+            monitor_index = self._resolve_monitor_index(monitor_identifier, is_id)
+            if monitor_index is None:
+                logger.warning(f"Monitor ID {monitor_identifier} not found")
+                return []
 
             logger.debug(
-                f"Looking for workspaces with windows on monitor {monitor_identifier} (index: {monitor_index})"
+                "Looking for workspaces with windows on monitor %s (index: %s)",
+                monitor_identifier, monitor_index,
             )
 
             # Get the current state
-            result = subprocess.run(
-                [self.komorebic_path, "state"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=5.0,
-                creationflags=CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-            )
-
-            if result.returncode != 0:
-                logger.error(f"Failed to get komorebi state: {result.stderr}")
-                return []
-
-            # Parse JSON state
-            state_data = json.loads(result.stdout)
-
-            # Find the monitor by index
-            monitors = state_data.get("monitors", {}).get("elements", [])
-            if monitor_index >= len(monitors):
-                logger.warning(
-                    f"Monitor index {monitor_index} not found in state (total monitors: {len(monitors)})"
-                )
+            if state_data is None:
+                state_data = self._get_state_cached()
+            if state_data is None:
                 return []
 
-            monitor = monitors[monitor_index]
-            workspaces = monitor.get("workspaces", {}).get("elements", [])
-
-            logger.debug(
-                f"Found {len(workspaces)} workspaces on monitor {monitor_identifier}"
-            )
-
-            workspaces_with_windows = []
-
-            # Check each workspace for windows
-            for workspace_index, workspace in enumerate(workspaces):
-                containers = workspace.get("containers", {}).get("elements", [])
-                floating_windows = workspace.get("floating_windows", {}).get(
-                    "elements", []
-                )
-                maximized_window = workspace.get("maximized_window")
-
-                # Check if workspace has any windows
-                has_windows = (
-                    len(containers) > 0
-                    or len(floating_windows) > 0
-                    or maximized_window is not None
-                )
-
-                logger.debug(
-                    f"Workspace {workspace_index}: containers={len(containers)}, floating={len(floating_windows)}, maximized={maximized_window is not None}, has_windows={has_windows}"
-                )
-
-                if has_windows:
-                    workspaces_with_windows.append(workspace_index)
-
-            logger.debug(
-                f"Found {len(workspaces_with_windows)} workspaces with windows on monitor {monitor_identifier}: {workspaces_with_windows}"
-            )
+            return _workspaces_with_windows_from_state(state_data, monitor_index)
 
-            # If no workspaces with windows found, but we know there should be some,
-            # return all workspaces as a fallback (this allows cycling through all workspaces)
-            if not workspaces_with_windows and len(workspaces) > 0:
-                logger.info(
-                    f"No workspaces with windows detected on monitor {monitor_identifier}, falling back to all {len(workspaces)} workspaces"
-                )
-                return list(range(len(workspaces)))
-
-            return workspaces_with_windows
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse komorebi state JSON: {e}")
-            return []
         except Exception as e:
             logger.error(
                 f"Failed to get workspaces with windows for monitor {monitor_identifier}: {e}"
@@ -571,23 +986,10 @@ class KomorebiClient:
         """
         try:
             # Get the current state
-            result = subprocess.run(
-                [self.komorebic_path, "state"],
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
-                timeout=5.0,
-                creationflags=CREATE_NO_WINDOW if sys.platform == "win32" else 0,
-            )
-
-            if result.returncode != 0:
-                logger.error(f"Failed to get komorebi state: {result.stderr}")
+            state_data = self._get_state_cached()
+            if state_data is None:
                 return False
 
-            # Parse JSON state
-            state_data = json.loads(result.stdout)
-
             # Find the monitor by index
             monitors = state_data.get("monitors", {}).get("elements", [])
             if monitor_index >= len(monitors):
@@ -599,17 +1001,8 @@ class KomorebiClient:
             if workspace_index >= len(workspaces):
                 return False
 
-            workspace = workspaces[workspace_index]
-            containers = workspace.get("containers", {}).get("elements", [])
-            floating_windows = workspace.get("floating_windows", {}).get("elements", [])
-            maximized_window = workspace.get("maximized_window")
-
             # Check if workspace has any windows
-            return (
-                len(containers) > 0
-                or len(floating_windows) > 0
-                or maximized_window is not None
-            )
+            return _has_windows(workspaces[workspace_index])
 
         except Exception as e:
             logger.error(
@@ -618,7 +1011,7 @@ class KomorebiClient:
             return False
 
     def switch_to_workspace_on_monitor(
-        self, monitor_identifier: int, workspace_index: int
+        self, monitor_identifier: int, workspace_index: int, *, is_id: bool = False
     ) -> bool:
         """
         Switch to a specific workspace on a specific monitor.
@@ -626,20 +1019,16 @@ class KomorebiClient:
         Args:
             monitor_identifier: The monitor index (0-based) or Komorebi monitor ID
             workspace_index: The workspace index to switch to (0-based)
+            is_id: True if monitor_identifier is a Komorebi monitor ID
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Determine if this is a monitor ID or index
-            # If it's a large number, it's likely a monitor ID
-            if monitor_identifier > 1000:  # Monitor IDs are typically large numbers
-                monitor_index = self.get_monitor_index_from_id(monitor_identifier)
-                if monitor_index is None:
-                    logger.error(f"Monitor ID {monitor_identifier} not found")
-                    return False
-            else:
-                monitor_index = monitor_identifier
+            monitor_index = self._resolve_monitor_index(monitor_identifier, is_id)
+            if monitor_index is None:
+                logger.error(f"Monitor ID {monitor_identifier} not found")
+                return False
 
             # Use the single focus-monitor-workspace command for efficiency
             result = subprocess.run(
@@ -663,6 +1052,9 @@ class KomorebiClient:
                 )
                 return False
 
+            # Focus changed; don't serve the pre-switch state to the next read
+            self.invalidate_state_cache()
+
             logger.info(
                 f"Successfully switched to workspace {workspace_index} on monitor {monitor_identifier}"
             )
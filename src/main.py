@@ -6,23 +6,25 @@ Orchestrates all components and provides the main application loop.
 """
 
 import logging
+import os
 import sys
 import time
 from typing import Optional
 
 # Add these imports for fullscreen detection
-import win32gui
 import win32con
 import win32api
 import win32process
 import ctypes
+from ctypes import wintypes
 
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QAbstractNativeEventFilter, QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QApplication
 
 from .floating_window_manager import FloatingWindowManager
-from .komorebi_client import KomorebiClient, WorkspaceState
+from .komorebi_client import KomorebiClient
 from .monitor_manager import MonitorManager
+from .template import TemplateRenderer
 
 # Configure logging
 
@@ -33,20 +35,23 @@ def configure_logging(log_level: str = None):
     
     Args:
         log_level: Logging level ('debug', 'info', 'warning', 'error', 'critical')
-                  If None, logging is effectively disabled (level 100)
+                  If None, logging is disabled and no handlers are installed
     """
     if log_level is None:
-        # Set to level 100 to effectively disable all logging
-        level = 100
-    else:
-        level_map = {
-            'debug': logging.DEBUG,
-            'info': logging.INFO,
-            'warning': logging.WARNING,
-            'error': logging.ERROR,
-            'critical': logging.CRITICAL
-        }
-        level = level_map.get(log_level.lower(), 100)
+        # Disabled: skip installing handlers (and opening the log file) entirely;
+        # Logger.isEnabledFor() now rejects every record before any formatting
+        logging.disable(logging.CRITICAL)
+        return
+
+    level_map = {
+        'debug': logging.DEBUG,
+        'info': logging.INFO,
+        'warning': logging.WARNING,
+        'error': logging.ERROR,
+        'critical': logging.CRITICAL
+    }
+    level = level_map.get(log_level.lower(), 100)
+    logging.disable(logging.NOTSET)  # Undo an earlier disable on reconfigure
     
     # Configure logging
     logging.basicConfig(
@@ -60,10 +65,91 @@ def configure_logging(log_level: str = None):
 
 logger = logging.getLogger(__name__)
 
+# Environment variable carrying the name of the launcher's "ready" event (see run.py)
+READY_EVENT_ENV = "KOMOREBI_INDICATOR_READY_EVENT"
+
+
+def signal_ready():
+    """Signal the launcher's named ready event, if it is waiting on one."""
+    event_name = os.environ.pop(READY_EVENT_ENV, None)
+    if not event_name:
+        return
+    EVENT_MODIFY_STATE = 0x0002
+    kernel32 = ctypes.windll.kernel32
+    kernel32.OpenEventW.restype = wintypes.HANDLE
+    kernel32.SetEvent.argtypes = [wintypes.HANDLE]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    handle = kernel32.OpenEventW(EVENT_MODIFY_STATE, False, event_name)
+    if handle:
+        kernel32.SetEvent(handle)
+        kernel32.CloseHandle(handle)
+
+
+# SetWinEventHook callback: (hWinEventHook, event, hwnd, idObject, idChild, idEventThread, dwmsEventTime)
+WinEventProcType = ctypes.WINFUNCTYPE(
+    None,
+    wintypes.HANDLE,
+    wintypes.DWORD,
+    wintypes.HWND,
+    wintypes.LONG,
+    wintypes.LONG,
+    wintypes.DWORD,
+    wintypes.DWORD,
+)
+
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+WINEVENT_OUTOFCONTEXT = 0x0000
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+
+
+class KomorebiEventBridge(QObject):
+    """Carries komorebi's pushed-state notifications onto the Qt main thread."""
+
+    # Emitted from the subscription reader thread; connect with a queued connection
+    stateChanged = pyqtSignal()
+
+
+class PowerEventFilter(QAbstractNativeEventFilter):
+    """Reports system suspend/resume from the WM_POWERBROADCAST messages our windows receive."""
+
+    WM_POWERBROADCAST = 0x0218
+    PBT_APMSUSPEND = 0x0004
+    PBT_APMRESUMESUSPEND = 0x0007
+    PBT_APMRESUMEAUTOMATIC = 0x0012
+
+    def __init__(self, on_suspend, on_resume):
+        """
+        Initialize the filter.
+
+        Args:
+            on_suspend: Called when the system is about to suspend
+            on_resume: Called when the system resumes from suspend
+        """
+        super().__init__()
+        self._on_suspend = on_suspend
+        self._on_resume = on_resume
+
+    def nativeEventFilter(self, eventType, message):
+        """Inspect native messages; never consumes them."""
+        if eventType == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == self.WM_POWERBROADCAST:
+                if msg.wParam == self.PBT_APMSUSPEND:
+                    self._on_suspend()
+                elif msg.wParam in (self.PBT_APMRESUMESUSPEND, self.PBT_APMRESUMEAUTOMATIC):
+                    self._on_resume()
+        return False, 0
+
 
 class KomorebiIndicatorApp:
     """Main application class for the Komorebi Floating Workspace Indicator."""
 
+    FAST_POLL_INTERVAL_MS = 50  # Poll interval right after a change
+    STABLE_TICKS_BEFORE_BACKOFF = 10  # Unchanged fast polls before returning to poll_interval
+
     def __init__(
         self, 
         template: Optional[str] = None, 
@@ -72,6 +158,7 @@ class KomorebiIndicatorApp:
         show_layout: bool = False,
         opacity: Optional[float] = None,
         poll_interval_ms: int = 1000,
+        render: Optional[TemplateRenderer] = None,
     ):
         """
         Initialize the application.
@@ -83,6 +170,7 @@ class KomorebiIndicatorApp:
             show_layout: Whether to show workspace layout
             opacity: Window opacity (0.0 to 1.0)
             poll_interval_ms: Polling interval in milliseconds
+            render: Precompiled renderer for template (see template.compile_template)
         """
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("Komorebi Floating Workspace Indicator")
@@ -99,21 +187,57 @@ class KomorebiIndicatorApp:
             show_layout=show_layout,
             komorebi_client=self.komorebi_client,
             opacity=opacity,
+            render=render,
+        )
+
+        # Pushed komorebi state drives updates; the poll only covers the gaps
+        self._event_bridge = KomorebiEventBridge()
+        self._event_bridge.stateChanged.connect(
+            self._on_komorebi_event, Qt.ConnectionType.QueuedConnection
         )
+        self.komorebi_client.on_state_pushed = self._event_bridge.stateChanged.emit
 
         # Setup polling timer
         self.poll_timer = QTimer()
         self.poll_timer.timeout.connect(self._poll_workspace_state)
         self.poll_interval = poll_interval_ms
+        # Poll quickly after a change, back off to poll_interval once things settle
+        self._fast_interval = min(self.FAST_POLL_INTERVAL_MS, poll_interval_ms)
+        self._slow_interval = poll_interval_ms
+        self._stable_ticks = 0
+
+        # Pause polling while the session is suspended or the app is hidden
+        self.app.applicationStateChanged.connect(self._on_application_state_changed)
+        self._power_filter = PowerEventFilter(self._pause_polling, self._resume_polling)
+        self.app.installNativeEventFilter(self._power_filter)
 
         # State tracking - track (workspace_index, workspace_name, workspace_layout, workspace_layout_flip) per monitor
         self.monitor_workspace_states = {}  # monitor_id -> (workspace_index, workspace_name, workspace_layout, workspace_layout_flip)
         self.last_update_time = {}  # monitor_id -> timestamp (for log throttling only)
         self.is_running = False
+        self._indicators_visible = True  # start() shows them; the poll only acts on transitions
+        # Foreground-window hooks keep _focus_is_fullscreen current between polls
+        self._win_event_proc = WinEventProcType(self._on_foreground_change)
+        self._win_event_hooks = []
+        self._location_hook = None  # Location-change hook scoped to the foreground window's thread
+        self._focus_is_fullscreen = False
+
+        # Foreground window lookups via ctypes, reusing one RECT instead of a tuple per call
+        user32 = ctypes.windll.user32
+        self._GetForegroundWindow = user32.GetForegroundWindow
+        self._GetForegroundWindow.argtypes = []
+        self._GetForegroundWindow.restype = wintypes.HWND
+        self._GetWindowRect = user32.GetWindowRect
+        self._GetWindowRect.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.RECT)]
+        self._GetWindowRect.restype = wintypes.BOOL
+        self._rect_buf = wintypes.RECT()
+        self._rect_buf_ref = ctypes.byref(self._rect_buf)
+        # Logging is configured before the app is created, so this holds for its lifetime
+        self._info_enabled = logger.isEnabledFor(logging.INFO)
 
         logger.info("Komorebi Floating Workspace Indicator initialized")
         if template:
-            logger.info(f"Using custom template: '{template}'")
+            logger.info("Using custom template: '%s'", template)
 
     def start(self):
         """Start the application."""
@@ -127,29 +251,32 @@ class KomorebiIndicatorApp:
             logger.info("Komorebi detected and accessible")
 
             # Log monitor configuration
-            logger.info(self.monitor_manager.get_monitor_summary())
+            if self._info_enabled:
+                logger.info(self.monitor_manager.get_monitor_summary())
 
             # Initialize workspace state for all monitors
             self._initialize_workspace_states()
 
             # Show workspace indicators
             self.window_manager.show_all_indicators()
+            self._install_foreground_hooks()
+            signal_ready()
 
             # Start polling for workspace changes
             self.poll_timer.start(self.poll_interval)
             self.is_running = True
 
             logger.info(
-                f"Started polling for workspace changes every {self.poll_interval}ms"
+                "Started polling for workspace changes every %dms", self.poll_interval
             )
             logger.info(
-                f"Created {self.window_manager.get_indicator_count()} workspace indicators"
+                "Created %d workspace indicators", self.window_manager.get_indicator_count()
             )
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to start application: {e}")
+            logger.error("Failed to start application: %s", e)
             return False
 
     def _initialize_workspace_states(self):
@@ -166,7 +293,8 @@ class KomorebiIndicatorApp:
                         getattr(state, "workspace_layout_flip", None),
                     )
                     logger.info(
-                        f"Initialized monitor {state.monitor_index} with workspace {state.workspace_index}"
+                        "Initialized monitor %s with workspace %s",
+                        state.monitor_index, state.workspace_index,
                     )
                     # Update the specific indicator for this monitor
                     self.window_manager.update_workspace_state(state)
@@ -182,13 +310,14 @@ class KomorebiIndicatorApp:
                             getattr(current_state, "workspace_layout_flip", None),
                         )
                         logger.info(
-                            f"Initialized monitor {monitor.id} with workspace {current_state.workspace_index}"
+                            "Initialized monitor %s with workspace %s",
+                            monitor.id, current_state.workspace_index,
                         )
                     self.window_manager.initialize_all_indicators(
                         current_state.workspace_index
                     )
         except Exception as e:
-            logger.error(f"Failed to initialize workspace states: {e}")
+            logger.error("Failed to initialize workspace states: %s", e)
 
     def stop(self):
         """Stop the application."""
@@ -196,59 +325,196 @@ class KomorebiIndicatorApp:
 
         self.is_running = False
         self.poll_timer.stop()
+        self._remove_foreground_hooks()
+        self.komorebi_client.on_state_pushed = None
         self.window_manager.hide_all_indicators()
+        self.komorebi_client.close()
 
         logger.info("Application stopped")
 
-    def _is_focused_window_fullscreen(self, monitor_rects=None):
+    def _install_foreground_hooks(self):
+        """Track foreground changes with WinEvent hooks instead of querying every poll."""
+        user32 = ctypes.windll.user32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.UnhookWinEvent.argtypes = [wintypes.HANDLE]
+        for event in (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_MOVESIZEEND):
+            # Out-of-context callbacks arrive through this thread's message loop (Qt's)
+            hook = user32.SetWinEventHook(
+                event, event, 0, self._win_event_proc, 0, 0, WINEVENT_OUTOFCONTEXT
+            )
+            if not hook:
+                logger.warning("SetWinEventHook failed, checking the foreground window every poll")
+                self._remove_foreground_hooks()
+                return
+            self._win_event_hooks.append(hook)
+        self._hook_foreground_location(self._GetForegroundWindow())
+        self._focus_is_fullscreen = self._is_focused_window_fullscreen()
+
+    def _hook_foreground_location(self, hwnd):
         """
-        Check if the currently focused window is running fullscreen on any monitor.
-        Args:
-            monitor_rects: Optional list of monitor rects (left, top, right, bottom)
+        Watch location changes of the foreground window's thread only.
+
+        Catches windows going fullscreen in place (F11, video, games) without
+        waking up for every cursor move or window animation system-wide.
+        """
+        user32 = ctypes.windll.user32
+        if self._location_hook:
+            user32.UnhookWinEvent(self._location_hook)
+            self._location_hook = None
+        # A callback queued before _remove_foreground_hooks must not re-install it
+        if not self._win_event_hooks or not hwnd or self.window_manager.is_own_hwnd(hwnd):
+            return
+        process_id = wintypes.DWORD()
+        thread_id = user32.GetWindowThreadProcessId(hwnd, ctypes.byref(process_id))
+        if not thread_id:
+            return
+        self._location_hook = user32.SetWinEventHook(
+            EVENT_OBJECT_LOCATIONCHANGE, EVENT_OBJECT_LOCATIONCHANGE, 0,
+            self._win_event_proc, process_id.value, thread_id, WINEVENT_OUTOFCONTEXT,
+        ) or None
+
+    def _remove_foreground_hooks(self):
+        """Unregister the WinEvent hooks, if installed."""
+        hooks, self._win_event_hooks = self._win_event_hooks, []
+        if self._location_hook:
+            hooks.append(self._location_hook)
+            self._location_hook = None
+        if hooks:
+            user32 = ctypes.windll.user32
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+
+    def _on_foreground_change(self, hook, event, hwnd, id_object, id_child, thread_id, event_time):
+        """WinEvent callback: reclassify the foreground window, react at once if it flipped."""
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF:
+            return
+        if event == EVENT_SYSTEM_FOREGROUND:
+            self._hook_foreground_location(hwnd)
+        # The location hook covers the foreground window's whole thread; only that window matters
+        elif event == EVENT_OBJECT_LOCATIONCHANGE and hwnd != self._GetForegroundWindow():
+            return
+        fullscreen = self._is_focused_window_fullscreen()
+        if fullscreen != self._focus_is_fullscreen:
+            self._focus_is_fullscreen = fullscreen
+            self._poll_workspace_state()
+
+    def _is_focused_window_fullscreen(self):
+        """
+        Check if the currently focused window is running fullscreen on its monitor.
         Returns:
             True if a fullscreen window is detected, False otherwise
         """
         try:
-            hwnd = win32gui.GetForegroundWindow()
-            if hwnd == 0:
+            hwnd = self._GetForegroundWindow()
+            if not hwnd:
                 return False
             # Ignore our own indicator windows
-            title = win32gui.GetWindowText(hwnd)
-            if "KomorebiWorkspaceIndicator" in title:
+            if self.window_manager.is_own_hwnd(hwnd):
                 return False
-            rect = win32gui.GetWindowRect(hwnd)
-            l, t, r, b = rect
-            # Get all monitor rects if not provided
-            if monitor_rects is None:
-                monitor_rects = [m.rect for m in self.monitor_manager.get_monitors()]
-            for mon_l, mon_t, mon_r, mon_b in monitor_rects:
-                # Allow a small tolerance for borders
-                if abs(l - mon_l) <= 2 and abs(t - mon_t) <= 2 and abs(r - mon_r) <= 2 and abs(b - mon_b) <= 2:
-                    return True
-            return False
+            if not self._GetWindowRect(hwnd, self._rect_buf_ref):
+                return False
+            rect = self._rect_buf
+            # Only the monitor the window is on can hold it fullscreen
+            hmon = win32api.MonitorFromWindow(hwnd, win32con.MONITOR_DEFAULTTONEAREST)
+            mon_l, mon_t, mon_r, mon_b = win32api.GetMonitorInfo(hmon)["Monitor"]
+            # Allow a small tolerance for borders
+            return (
+                abs(rect.left - mon_l) <= 2
+                and abs(rect.top - mon_t) <= 2
+                and abs(rect.right - mon_r) <= 2
+                and abs(rect.bottom - mon_b) <= 2
+            )
         except Exception as e:
-            logger.error(f"Error checking fullscreen window: {e}")
+            logger.error("Error checking fullscreen window: %s", e)
             return False
 
+    def _pause_polling(self):
+        """Stop the poll timer until _resume_polling is called."""
+        if self.poll_timer.isActive():
+            self.poll_timer.stop()
+            logger.info("Polling paused")
+
+    def _resume_polling(self):
+        """Restart the poll timer and catch up on anything missed while paused."""
+        if self.is_running and not self.poll_timer.isActive():
+            self.poll_timer.start(self.poll_interval)
+            logger.info("Polling resumed")
+            self._poll_workspace_state()
+
+    def _on_application_state_changed(self, state):
+        """Pause polling while Qt reports the application as suspended or hidden."""
+        if state in (
+            Qt.ApplicationState.ApplicationSuspended,
+            Qt.ApplicationState.ApplicationHidden,
+        ):
+            self._pause_polling()
+        else:
+            self._resume_polling()
+
+    def _on_komorebi_event(self):
+        """Update the indicators from state komorebi just pushed over the subscription pipe."""
+        if not self.is_running:
+            return
+        self._update_workspace_states()
+
     def _poll_workspace_state(self):
-        """Poll for workspace state changes and hide indicator if fullscreen app is focused."""
+        """Hide indicators if a fullscreen app is focused; poll state when not subscribed."""
         if not self.is_running:
             return
 
+        changed = False
         try:
             # Hide indicators if fullscreen app is focused
-            if self._is_focused_window_fullscreen():
-                self.window_manager.hide_all_indicators()
-                return
+            if self._win_event_hooks:
+                fullscreen = self._focus_is_fullscreen
             else:
-                self.window_manager.show_all_indicators()
+                fullscreen = self._is_focused_window_fullscreen()
+            # Shown while fullscreen, or hidden while not: flip visibility
+            if fullscreen == self._indicators_visible:
+                changed = True
+                if fullscreen:
+                    self.window_manager.hide_all_indicators()
+                else:
+                    self.window_manager.show_all_indicators()
+                self._indicators_visible = not fullscreen
+        except Exception as e:
+            logger.error("Error during workspace polling: %s", e)
+            return
+
+        # Pushed state arrives through _on_komorebi_event; only poll while the pipe is down
+        if not fullscreen and not self.komorebi_client.is_subscribed():
+            changed = self._update_workspace_states() or changed
+
+        self._adapt_poll_interval(changed)
+
+    def _adapt_poll_interval(self, changed: bool):
+        """Switch to the fast interval after a change, back to the slow one once stable."""
+        if changed:
+            self._stable_ticks = 0
+            interval = self._fast_interval
+        else:
+            self._stable_ticks += 1
+            if self._stable_ticks < self.STABLE_TICKS_BEFORE_BACKOFF:
+                return
+            interval = self._slow_interval
+        if self.poll_timer.interval() != interval:
+            self.poll_timer.setInterval(interval)
+
+    def _update_workspace_states(self) -> bool:
+        """
+        Push the current workspace state of every monitor to the indicators.
 
+        Returns:
+            True if any monitor's workspace state changed, False otherwise
+        """
+        changed = False
+        try:
             # Get workspace state for all monitors
             all_states = self.komorebi_client.get_all_monitors_workspace_state()
 
             if not all_states:
                 logger.warning("Failed to get workspace states for all monitors")
-                return
+                return False
 
             current_time = time.time()
 
@@ -257,62 +523,36 @@ class KomorebiIndicatorApp:
             for current_state in all_states:
                 self.window_manager.update_workspace_state(current_state)
 
-                # Log only when something changed (throttle log spam)
+                # Any displayed property (workspace, name, layout, layout_flip) counts;
+                # a monitor seen for the first time compares unequal to None
                 monitor_id = current_state.monitor_index
+                displayed = (
+                    current_state.workspace_index,
+                    current_state.workspace_name,
+                    current_state.workspace_layout,
+                    current_state.workspace_layout_flip,
+                )
+                if self.monitor_workspace_states.get(monitor_id) == displayed:
+                    continue
+                changed = True
+                self.monitor_workspace_states[monitor_id] = displayed
+
+                # Log only when something changed (throttle log spam)
                 last_update = self.last_update_time.get(monitor_id, 0)
-                if current_time - last_update >= 0.5 and self._has_state_changed(
-                    current_state
-                ):
-                    logger.info(
-                        f"Workspace changed: Monitor {monitor_id} -> "
-                        f"W{current_state.workspace_index} "
-                        f"name={current_state.workspace_name!r} layout={current_state.workspace_layout!r}"
-                    )
-                    self.monitor_workspace_states[monitor_id] = (
-                        current_state.workspace_index,
-                        current_state.workspace_name,
-                        current_state.workspace_layout,
-                        getattr(current_state, "workspace_layout_flip", None),
-                    )
+                if current_time - last_update >= 0.5:
+                    if self._info_enabled:
+                        logger.info(
+                            "Workspace changed: Monitor %s -> W%s name=%r layout=%r",
+                            monitor_id,
+                            current_state.workspace_index,
+                            current_state.workspace_name,
+                            current_state.workspace_layout,
+                        )
                     self.last_update_time[monitor_id] = current_time
 
-            # Ensure we have stored state for all monitors (for next poll's change detection)
-            for current_state in all_states:
-                monitor_id = current_state.monitor_index
-                if monitor_id not in self.monitor_workspace_states:
-                    self.monitor_workspace_states[monitor_id] = (
-                        current_state.workspace_index,
-                        current_state.workspace_name,
-                        current_state.workspace_layout,
-                        getattr(current_state, "workspace_layout_flip", None),
-                    )
-
         except Exception as e:
-            logger.error(f"Error during workspace polling: {e}")
-
-    def _has_state_changed(self, current_state: WorkspaceState) -> bool:
-        """True if any displayed property (workspace, name, layout, layout_flip) changed."""
-        monitor_id = current_state.monitor_index
-        if monitor_id not in self.monitor_workspace_states:
-            return True
-        prev = self.monitor_workspace_states[monitor_id]
-        # Unpack: (workspace_index, workspace_name, workspace_layout, workspace_layout_flip) or legacy
-        if isinstance(prev, tuple):
-            prev_idx = prev[0] if len(prev) > 0 else None
-            prev_name = prev[1] if len(prev) > 2 else None
-            prev_layout = prev[2] if len(prev) > 2 else (prev[1] if len(prev) == 2 else None)
-            prev_flip = prev[3] if len(prev) > 3 else None
-            if len(prev) == 2:
-                prev_name = None  # (idx, layout) legacy
-        else:
-            prev_idx, prev_name, prev_layout, prev_flip = prev, None, None, None
-        current_flip = getattr(current_state, "workspace_layout_flip", None)
-        return (
-            prev_idx != current_state.workspace_index
-            or prev_name != current_state.workspace_name
-            or prev_layout != current_state.workspace_layout
-            or prev_flip != current_flip
-        )
+            logger.error("Error updating workspace states: %s", e)
+        return changed
 
     def run(self):
         """Run the application main loop."""
@@ -327,7 +567,7 @@ class KomorebiIndicatorApp:
             self.stop()
             return 0
         except Exception as e:
-            logger.error(f"Application error: {e}")
+            logger.error("Application error: %s", e)
             self.stop()
             return 1
         finally:
@@ -342,6 +582,7 @@ def main(
     log_level: str = None,
     opacity: Optional[float] = None,
     poll_interval_ms: int = 1000,
+    render: Optional[TemplateRenderer] = None,
 ):
     """
     Main entry point.
@@ -355,6 +596,7 @@ def main(
                   If None, logging is effectively disabled
         opacity: Window opacity (0.0 to 1.0)
         poll_interval_ms: Polling interval in milliseconds
+        render: Precompiled renderer for template; compiled from template if None
     """
     # Configure logging first
     configure_logging(log_level)
@@ -367,10 +609,11 @@ def main(
             show_layout=show_layout,
             opacity=opacity,
             poll_interval_ms=poll_interval_ms,
+            render=render,
         )
         return app.run()
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         return 1
 
 
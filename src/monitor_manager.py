@@ -6,7 +6,8 @@ Provides information about monitor geometry, positioning, and properties.
 """
 
 import logging
-from dataclasses import dataclass
+import operator
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 from .komorebi_client import KomorebiClient
@@ -26,6 +27,14 @@ class MonitorInfo:
     width: int
     height: int
     dpi: int
+    # rect's edges as plain attributes, derived once instead of unpacked per query
+    left: int = field(init=False)
+    top: int = field(init=False)
+    right: int = field(init=False)
+    bottom: int = field(init=False)
+
+    def __post_init__(self):
+        self.left, self.top, self.right, self.bottom = self.rect
 
 
 class MonitorManager:
@@ -40,6 +49,11 @@ class MonitorManager:
         """
         self.komorebi_client = komorebi_client
         self._monitors: Dict[int, MonitorInfo] = {}  # key: monitor_id
+        # Monitors ordered by rect (left, then top), rebuilt on every refresh
+        self.sorted_monitors: Tuple[MonitorInfo, ...] = ()
+        # Flat (left, top, right, bottom, monitor) rows for point lookups
+        self._monitor_bounds: Tuple[Tuple[int, int, int, int, MonitorInfo], ...] = ()
+        self._summary = ""  # get_monitor_summary() text, rebuilt on every refresh
         self._refresh_monitors()
 
     def _refresh_monitors(self):
@@ -56,14 +70,12 @@ class MonitorManager:
                 if komorebi_monitor.device != "UNKNOWN":
                     valid_monitors.append(komorebi_monitor)
                 else:
-                    logger.info(f"Skipping UNKNOWN monitor {komorebi_monitor.id}")
+                    logger.info("Skipping UNKNOWN monitor %s", komorebi_monitor.id)
 
             # Calculate the narrowest monitor width for fallback (only from valid monitors)
             min_width = 10000
             for komorebi_monitor in valid_monitors:
-                size = komorebi_monitor.size
-                left = size["left"]
-                right = size["right"]
+                left, _, right, _ = komorebi_monitor.size
 
                 # Only consider monitors with valid width for min_width calculation
                 if right != left:
@@ -77,17 +89,13 @@ class MonitorManager:
 
             # Create monitor info objects for valid monitors only
             for i, komorebi_monitor in enumerate(valid_monitors):
-                size = komorebi_monitor.size
-                left = size["left"]
-                top = size["top"]
-                right = size["right"]
-                bottom = size["bottom"]
+                left, top, right, bottom = komorebi_monitor.size
 
                 # Fix for zero width/height using narrowest monitor width
                 if right == left:
                     right = left + min_width
                     logger.info(
-                        f"Using fallback width {min_width} for monitor {komorebi_monitor.id}"
+                        "Using fallback width %d for monitor %s", min_width, komorebi_monitor.id
                     )
                 if bottom == top:
                     bottom = top + 1080  # fallback height
@@ -112,12 +120,22 @@ class MonitorManager:
 
                 self._monitors[komorebi_monitor.id] = monitor_info
                 logger.info(
-                    f"Detected monitor {komorebi_monitor.id}: {monitor_info.name} "
-                    f"({monitor_info.width}x{monitor_info.height}) at {rect}"
+                    "Detected monitor %s: %s (%dx%d) at %s",
+                    komorebi_monitor.id, monitor_info.name,
+                    monitor_info.width, monitor_info.height, rect,
                 )
 
         except Exception as e:
-            logger.error(f"Failed to refresh monitors: {e}")
+            logger.error("Failed to refresh monitors: %s", e)
+
+        self.sorted_monitors = tuple(
+            sorted(self._monitors.values(), key=operator.attrgetter("rect"))
+        )
+        self._monitor_bounds = tuple(
+            (monitor.left, monitor.top, monitor.right, monitor.bottom, monitor)
+            for monitor in self._monitors.values()
+        )
+        self._summary = self._build_summary()
 
     def get_monitors(self) -> List[MonitorInfo]:
         """
@@ -172,8 +190,7 @@ class MonitorManager:
         Returns:
             MonitorInfo object or None if position is not on any monitor
         """
-        for monitor in self._monitors.values():
-            left, top, right, bottom = monitor.rect
+        for left, top, right, bottom, monitor in self._monitor_bounds:
             if left <= x <= right and top <= y <= bottom:
                 return monitor
         return None
@@ -192,30 +209,35 @@ class MonitorManager:
         if monitor is None:
             return None
 
-        left, top, right, bottom = monitor.rect
-        center_x = (left + right) // 2
-        return (center_x, top)
+        center_x = (monitor.left + monitor.right) // 2
+        return (center_x, monitor.top)
 
     def refresh(self):
         """Refresh monitor information (useful for hot-plugging)."""
         logger.info("Refreshing monitor information...")
+        self.komorebi_client.invalidate_monitors()
         self._refresh_monitors()
 
-    def get_monitor_summary(self) -> str:
-        """
-        Get a summary of all monitors for logging/debugging.
-
-        Returns:
-            Formatted string with monitor information
-        """
+    def _build_summary(self) -> str:
+        """Format the monitor summary returned by get_monitor_summary()."""
         if not self._monitors:
             return "No monitors detected"
 
-        summary = f"Monitor Configuration ({len(self._monitors)} monitors):"
+        lines = [f"Monitor Configuration ({len(self._monitors)} monitors):"]
         for monitor in self._monitors.values():
             primary_marker = " [PRIMARY]" if monitor.is_primary else ""
-            summary += f"\n  Monitor {monitor.id}: {monitor.name} "
-            summary += f"({monitor.width}x{monitor.height}) at "
-            summary += f"({monitor.rect[0]},{monitor.rect[1]}) DPI: {monitor.dpi}{primary_marker}"
+            lines.append(
+                f"  Monitor {monitor.id}: {monitor.name} "
+                f"({monitor.width}x{monitor.height}) at "
+                f"({monitor.left},{monitor.top}) DPI: {monitor.dpi}{primary_marker}"
+            )
+        return "\n".join(lines)
 
-        return summary
+    def get_monitor_summary(self) -> str:
+        """
+        Get a summary of all monitors for logging/debugging.
+
+        Returns:
+            Formatted string with monitor information (cached until the next refresh)
+        """
+        return self._summary
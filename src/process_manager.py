@@ -5,6 +5,7 @@ Handles finding and stopping running instances of the application.
 """
 
 import os
+import re
 import sys
 import logging
 import psutil
@@ -13,6 +14,9 @@ from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Interpreters whose command line may name one of our scripts (run.py, main.py)
+PYTHON_IMAGE_PREFIXES = ("python", "py.exe", "pyw.exe")
+
 
 class ProcessManager:
     """Manages processes for the Komorebi Workspace Indicator application."""
@@ -21,6 +25,12 @@ class ProcessManager:
         """Initialize the process manager."""
         self.app_name = "komorebi-workspace-indicator"
         self.script_names = ["run.py", "komorebi-indicator.exe", "main.py"]
+        # Lowercased once: _is_app_process runs for every process on the system
+        self._script_names_lc = tuple(s.lower() for s in self.script_names)
+        # One case-insensitive scan per string instead of a substring test per name
+        self._script_names_pattern = re.compile(
+            "|".join(map(re.escape, self._script_names_lc)), re.IGNORECASE
+        )
         
     def get_current_process_info(self) -> dict:
         """
@@ -47,18 +57,25 @@ class ProcessManager:
         Returns:
             List of psutil.Process objects
         """
+        if sys.platform == 'win32':
+            try:
+                return self._find_app_processes_native(exclude_current)
+            except OSError as e:
+                logger.warning(f"Native process snapshot failed, using psutil: {e}")
+
         found_processes = []
         current_pid = os.getpid()
         
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'exe', 'cmdline']):
+            # Only the cheap name is prefetched; cmdline/exe are read on demand below
+            for proc in psutil.process_iter(['pid', 'name']):
                 try:
                     # Skip current process if requested
                     if exclude_current and proc.info['pid'] == current_pid:
                         continue
                     
-                    # Check if it's one of our executables
-                    if self._is_app_process(proc.info):
+                    # Check if it's one of our executables, then the command line
+                    if self._is_app_process(proc.info) or self._is_app_cmdline(proc):
                         found_processes.append(proc)
                         
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
@@ -69,6 +86,61 @@ class ProcessManager:
             logger.error(f"Error scanning processes: {e}")
             
         return found_processes
+
+    def _find_app_processes_native(self, exclude_current: bool) -> List[psutil.Process]:
+        """
+        Find app processes from one Windows process snapshot.
+
+        Only processes whose image name matches, or Python interpreters that
+        may be running one of our scripts, are opened at all.
+
+        Args:
+            exclude_current: Whether to exclude the current process from results
+
+        Returns:
+            List of psutil.Process objects
+
+        Raises:
+            OSError: If the process snapshot cannot be taken
+        """
+        from .process_manager_win32 import snapshot_processes
+
+        found_processes = []
+        current_pid = os.getpid()
+
+        for pid, name in snapshot_processes():
+            if exclude_current and pid == current_pid:
+                continue
+            name_matches = self._is_app_process({'name': name})
+            if not name_matches and not name.lower().startswith(PYTHON_IMAGE_PREFIXES):
+                continue
+            try:
+                proc = psutil.Process(pid)
+                if name_matches or self._is_app_cmdline(proc):
+                    found_processes.append(proc)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                # Process might have disappeared or we don't have access
+                continue
+
+        return found_processes
+
+    def _is_app_cmdline(self, proc: psutil.Process) -> bool:
+        """
+        Check a process's command line (or exe path if unreadable) for our scripts.
+
+        Args:
+            proc: Process whose name did not match
+
+        Returns:
+            True if this is an app process, False otherwise
+        """
+        with proc.oneshot():
+            try:
+                extra_info = {'cmdline': proc.cmdline()}
+            except psutil.AccessDenied:
+                # Command line unreadable: fall back to the executable path
+                extra_info = {'exe': proc.exe()}
+        return self._is_app_process(extra_info)
     
     def _is_app_process(self, proc_info: dict) -> bool:
         """
@@ -80,29 +152,22 @@ class ProcessManager:
         Returns:
             True if this is an app process, False otherwise
         """
-        name = proc_info.get('name', '').lower()
+        search = self._script_names_pattern.search
+        name = proc_info.get('name') or ''  # None when access is denied
         exe = proc_info.get('exe', '')
         cmdline = proc_info.get('cmdline', [])
         
         # Check executable name
-        if any(script_name.lower() in name for script_name in [s.lower() for s in self.script_names]):
+        if search(name):
             return True
             
         # Check executable path
-        if exe and any(script_name.lower() in exe.lower() for script_name in self.script_names):
+        if exe and search(exe):
             return True
             
-        # Check command line arguments
-        if cmdline:
-            cmdline_str = ' '.join(cmdline).lower()
-            if any(script_name.lower() in cmdline_str for script_name in self.script_names):
-                return True
-                
-            # Check for Python processes running our scripts
-            if 'python' in cmdline_str:
-                for script_name in self.script_names:
-                    if script_name.lower() in cmdline_str:
-                        return True
+        # Check command line arguments (this also covers Python running our scripts)
+        if cmdline and search(' '.join(cmdline)):
+            return True
         
         return False
     
@@ -131,58 +196,23 @@ class ProcessManager:
         
         logger.info(f"Found {len(processes)} application processes to stop")
         
+        # Signal every process first, then wait for all of them together
+        names = {}
+        terminated = []
         for proc in processes:
             try:
-                proc_info = {
-                    'pid': proc.pid,
-                    'name': proc.name(),
-                    'exe': proc.exe() if hasattr(proc, 'exe') else 'N/A',
-                    'cmdline': ' '.join(proc.cmdline()) if hasattr(proc, 'cmdline') else 'N/A'
-                }
-                
-                logger.info(f"Stopping process {proc.pid}: {proc_info['name']}")
+                names[proc.pid] = proc.name()
+                logger.info(f"Stopping process {proc.pid}: {names[proc.pid]}")
                 
                 # Try graceful termination first
                 proc.terminate()
-                
-                try:
-                    # Wait for process to terminate gracefully
-                    proc.wait(timeout=timeout)
-                    results['stopped'] += 1
-                    results['details'].append({
-                        'pid': proc_info['pid'],
-                        'name': proc_info['name'],
-                        'status': 'terminated_gracefully'
-                    })
-                    logger.info(f"Process {proc.pid} terminated gracefully")
-                    
-                except psutil.TimeoutExpired:
-                    if force:
-                        # Force kill if graceful termination failed
-                        logger.warning(f"Process {proc.pid} didn't terminate gracefully, force killing")
-                        proc.kill()
-                        proc.wait(timeout=5)
-                        results['stopped'] += 1
-                        results['details'].append({
-                            'pid': proc_info['pid'],
-                            'name': proc_info['name'],
-                            'status': 'force_killed'
-                        })
-                        logger.info(f"Process {proc.pid} force killed")
-                    else:
-                        results['failed'] += 1
-                        results['details'].append({
-                            'pid': proc_info['pid'],
-                            'name': proc_info['name'],
-                            'status': 'failed_to_terminate'
-                        })
-                        logger.error(f"Process {proc.pid} failed to terminate gracefully")
+                terminated.append(proc)
                         
             except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
                 results['failed'] += 1
                 results['details'].append({
                     'pid': proc.pid,
-                    'name': getattr(proc, 'name', lambda: 'Unknown')(),
+                    'name': names.get(proc.pid, 'Unknown'),
                     'status': f'error: {str(e)}'
                 })
                 logger.error(f"Error stopping process {proc.pid}: {e}")
@@ -191,10 +221,50 @@ class ProcessManager:
                 results['failed'] += 1
                 results['details'].append({
                     'pid': proc.pid,
-                    'name': getattr(proc, 'name', lambda: 'Unknown')(),
+                    'name': names.get(proc.pid, 'Unknown'),
                     'status': f'unexpected_error: {str(e)}'
                 })
                 logger.error(f"Unexpected error stopping process {proc.pid}: {e}")
+
+        # Wait for processes to terminate gracefully
+        gone, alive = psutil.wait_procs(terminated, timeout=timeout)
+        for proc in gone:
+            results['stopped'] += 1
+            results['details'].append({
+                'pid': proc.pid,
+                'name': names[proc.pid],
+                'status': 'terminated_gracefully'
+            })
+            logger.info(f"Process {proc.pid} terminated gracefully")
+
+        if force and alive:
+            # Force kill if graceful termination failed
+            for proc in alive:
+                logger.warning(f"Process {proc.pid} didn't terminate gracefully, force killing")
+                try:
+                    proc.kill()
+                except psutil.NoSuchProcess:
+                    pass  # Exited after all; wait_procs reports it as gone
+                except psutil.AccessDenied as e:
+                    logger.error(f"Error force killing process {proc.pid}: {e}")
+            killed, alive = psutil.wait_procs(alive, timeout=5)
+            for proc in killed:
+                results['stopped'] += 1
+                results['details'].append({
+                    'pid': proc.pid,
+                    'name': names[proc.pid],
+                    'status': 'force_killed'
+                })
+                logger.info(f"Process {proc.pid} force killed")
+
+        for proc in alive:
+            results['failed'] += 1
+            results['details'].append({
+                'pid': proc.pid,
+                'name': names[proc.pid],
+                'status': 'failed_to_terminate'
+            })
+            logger.error(f"Process {proc.pid} failed to terminate gracefully")
         
         return results
     
@@ -211,13 +281,15 @@ class ProcessManager:
         process_list = []
         for proc in processes:
             try:
-                proc_info = {
-                    'pid': proc.pid,
-                    'name': proc.name(),
-                    'exe': proc.exe() if hasattr(proc, 'exe') else 'N/A',
-                    'cmdline': ' '.join(proc.cmdline()) if hasattr(proc, 'cmdline') else 'N/A',
-                    'is_current': proc.pid == current_pid
-                }
+                # Read all attributes in a single kernel query
+                with proc.oneshot():
+                    proc_info = {
+                        'pid': proc.pid,
+                        'name': proc.name(),
+                        'exe': proc.exe() if hasattr(proc, 'exe') else 'N/A',
+                        'cmdline': ' '.join(proc.cmdline()) if hasattr(proc, 'cmdline') else 'N/A',
+                        'is_current': proc.pid == current_pid
+                    }
                 process_list.append(proc_info)
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 continue
@@ -0,0 +1,79 @@
+"""
+Windows process snapshot for Komorebi Workspace Indicator
+
+Lists every running process (PID and image name) with a single
+NtQuerySystemInformation call, without opening a handle to any process.
+"""
+
+import ctypes
+from ctypes import wintypes
+from typing import List, Tuple
+
+SYSTEM_PROCESS_INFORMATION_CLASS = 5
+STATUS_INFO_LENGTH_MISMATCH = 0xC0000004
+INITIAL_BUFFER_SIZE = 512 * 1024
+
+
+class UNICODE_STRING(ctypes.Structure):
+    _fields_ = [
+        ("Length", wintypes.USHORT),  # In bytes, without the terminator
+        ("MaximumLength", wintypes.USHORT),
+        ("Buffer", ctypes.c_void_p),
+    ]
+
+
+class SYSTEM_PROCESS_INFORMATION(ctypes.Structure):
+    """Leading fields of SYSTEM_PROCESS_INFORMATION; entries are variable-length."""
+
+    _fields_ = [
+        ("NextEntryOffset", wintypes.ULONG),
+        ("NumberOfThreads", wintypes.ULONG),
+        ("Reserved1", ctypes.c_byte * 48),
+        ("ImageName", UNICODE_STRING),
+        ("BasePriority", wintypes.LONG),
+        ("UniqueProcessId", wintypes.HANDLE),
+    ]
+
+
+def snapshot_processes() -> List[Tuple[int, str]]:
+    """
+    Take a snapshot of all running processes.
+
+    Returns:
+        List of (pid, image name) tuples; the idle process has an empty name
+
+    Raises:
+        OSError: If NtQuerySystemInformation fails
+    """
+    ntdll = ctypes.windll.ntdll
+    ntdll.NtQuerySystemInformation.restype = wintypes.LONG
+
+    size = INITIAL_BUFFER_SIZE
+    returned = wintypes.ULONG()
+    while True:
+        buffer = ctypes.create_string_buffer(size)
+        status = ntdll.NtQuerySystemInformation(
+            SYSTEM_PROCESS_INFORMATION_CLASS, buffer, size, ctypes.byref(returned)
+        ) & 0xFFFFFFFF
+        if status != STATUS_INFO_LENGTH_MISMATCH:
+            break
+        # Processes may start between calls: leave some headroom
+        size = max(size * 2, returned.value + 64 * 1024)
+    if status != 0:
+        raise OSError(f"NtQuerySystemInformation failed with status 0x{status:08X}")
+
+    processes = []
+    offset = 0
+    while True:
+        entry = SYSTEM_PROCESS_INFORMATION.from_buffer(buffer, offset)
+        image_name = entry.ImageName
+        # The name buffer points into our own buffer, so it is valid until we return
+        name = (
+            ctypes.wstring_at(image_name.Buffer, image_name.Length // 2)
+            if image_name.Buffer else ""
+        )
+        processes.append((entry.UniqueProcessId or 0, name))
+        if not entry.NextEntryOffset:
+            break
+        offset += entry.NextEntryOffset
+    return processes
@@ -0,0 +1,75 @@
+"""
+Template Module
+
+Compiles display templates (e.g. "M{monitor} W{workspace}") into render
+callables so the format string is parsed once instead of on every
+workspace update.
+
+Available placeholders: {monitor}, {workspace}, {name}, {layout}, {flip}
+A literal "\\n" (as typed on the command line) becomes a line break.
+"""
+
+import string
+from functools import lru_cache
+from typing import Callable, List, Mapping, Tuple
+
+# A render callable takes the placeholder values and returns display text
+TemplateRenderer = Callable[[Mapping[str, object]], str]
+
+_FORMATTER = string.Formatter()
+
+
+def _cleanup(text: str) -> str:
+    """Trim whitespace and the trailing colon left behind by an empty {name}."""
+    return text.strip().rstrip(":")
+
+
+@lru_cache(maxsize=32)
+def compile_template(template: str) -> TemplateRenderer:
+    """
+    Compile a template string into a render callable.
+
+    The returned callable gives the same result as
+    ``template.format_map(values).strip().rstrip(":")``, after each escaped
+    ``\\n`` in the template has been replaced by a newline.
+
+    Args:
+        template: Template string with placeholders
+
+    Returns:
+        Callable taking a mapping of placeholder values to display text
+    """
+    # Decoded once here so rendering never touches escapes; only \n is decoded,
+    # since unicode_escape would mangle non-ASCII text in the template
+    template = template.replace("\\n", "\n")
+
+    parts: List[Tuple[str, str, str, str]] = []
+    for literal, field_name, format_spec, conversion in _FORMATTER.parse(template):
+        if field_name is not None and (
+            not field_name.isidentifier() or (format_spec and "{" in format_spec)
+        ):
+            # Indexed/attribute fields or nested specs: let str.format handle it
+            return lambda values: _cleanup(template.format_map(values))
+        parts.append((literal, field_name, format_spec or "", conversion))
+
+    if len(parts) == 1 and parts[0][1] and not any(parts[0][i] for i in (0, 2, 3)):
+        # A lone bare placeholder such as the default "{workspace}": skip the join
+        field_name = parts[0][1]
+        return lambda values: _cleanup(str(values[field_name]))
+
+    # Output can only end in ":" if the template does not end in other literal text
+    tail = parts[-1][0].rstrip() if parts and parts[-1][1] is None else ""
+    cleanup = _cleanup if not tail or tail.endswith(":") else str.strip
+
+    def render(values: Mapping[str, object]) -> str:
+        chunks = []
+        for literal, field_name, format_spec, conversion in parts:
+            chunks.append(literal)
+            if field_name is not None:
+                value = values[field_name]
+                if conversion:
+                    value = _FORMATTER.convert_field(value, conversion)
+                chunks.append(format(value, format_spec))
+        return cleanup("".join(chunks))
+
+    return render
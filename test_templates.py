@@ -6,6 +6,12 @@ This script demonstrates how the template system works without requiring
 Komorebi to be running.
 """
 
+import io
+import sys
+
+from src.template import compile_template
+
+
 def format_display_text(template: str, monitor_index: int, workspace_index: int, workspace_name: str = None) -> str:
     """
     Format display text according to template.
@@ -19,11 +25,12 @@ def format_display_text(template: str, monitor_index: int, workspace_index: int,
     Returns:
         Formatted display text
     """
-    return template.format(
-        monitor=monitor_index,
-        workspace=workspace_index,
-        name=workspace_name if workspace_name else ""
-    ).strip().rstrip(':')  # Remove trailing colon if no name
+    # Parsed once per template string; the renderer also removes a trailing colon if no name
+    return compile_template(template)({
+        "monitor": monitor_index,
+        "workspace": workspace_index,
+        "name": workspace_name if workspace_name else "",
+    })
 
 def test_templates():
     """Test various template formats."""
@@ -45,16 +52,30 @@ def test_templates():
         "M{monitor} | W{workspace} | {name}"
     ]
     
-    print("Template Testing Results:")
-    print("=" * 50)
+    # Placeholder values for every case, built once and shared by all templates
+    case_values = [
+        {"monitor": monitor, "workspace": workspace, "name": name if name else ""}
+        for monitor, workspace, name in test_cases
+    ]
+    
+    # Collect the whole report and write it to stdout once at the end
+    buf = io.StringIO()
+    buf.write("Template Testing Results:\n")
+    buf.write("=" * 50 + "\n")
     
     for template in templates:
-        print(f"\nTemplate: '{template}'")
-        print("-" * 30)
+        buf.write(f"\nTemplate: '{template}'\n")
+        buf.write("-" * 30 + "\n")
         
-        for monitor, workspace, name in test_cases:
-            result = format_display_text(template, monitor, workspace, name)
-            print(f"  Monitor {monitor}, Workspace {workspace}, Name '{name}' -> '{result}'")
+        # Render all cases in one batch
+        render = compile_template(template)
+        results = [render(values) for values in case_values]
+        buf.writelines(
+            f"  Monitor {monitor}, Workspace {workspace}, Name '{name}' -> '{result}'\n"
+            for (monitor, workspace, name), result in zip(test_cases, results)
+        )
+
+    sys.stdout.write(buf.getvalue())
 
 if __name__ == "__main__":
     test_templates() 
\ No newline at end of file
@@ -1,55 +1,50 @@
 """Pytest configuration and shared fixtures."""
 
 import pytest
-from unittest.mock import Mock, patch
-from typing import Generator
+from types import MappingProxyType
+from unittest.mock import Mock
+from typing import Mapping
 
 
 @pytest.fixture
 def mock_komorebi_client() -> Mock:
-    """Mock Komorebi client for testing."""
+    """Mock Komorebi client for testing (fresh per test: a Mock records calls and attributes)."""
     mock_client = Mock()
-    mock_client.get_monitors.return_value = [
-        {"index": 1, "name": "Monitor 1"},
-        {"index": 2, "name": "Monitor 2"}
-    ]
-    mock_client.get_workspaces.return_value = [
-        {"index": 1, "name": "Work"},
-        {"index": 2, "name": "Personal"},
-        {"index": 3, "name": "Gaming"}
-    ]
+    mock_client.get_monitors.return_value = (
+        MappingProxyType({"index": 1, "name": "Monitor 1"}),
+        MappingProxyType({"index": 2, "name": "Monitor 2"}),
+    )
+    mock_client.get_workspaces.return_value = (
+        MappingProxyType({"index": 1, "name": "Work"}),
+        MappingProxyType({"index": 2, "name": "Personal"}),
+        MappingProxyType({"index": 3, "name": "Gaming"}),
+    )
     return mock_client
 
 
+@pytest.fixture(scope="session")
+def _qt_app_mock() -> Mock:
+    """Stand-in QApplication class, built once per session."""
+    mock_app = Mock()
+    mock_app.instance.return_value = Mock()
+    return mock_app
+
+
 @pytest.fixture
-def mock_qt_app() -> Generator[Mock, None, None]:
+def mock_qt_app(_qt_app_mock: Mock, monkeypatch: pytest.MonkeyPatch) -> Mock:
     """Mock Qt application for testing."""
-    with patch("PyQt6.QtWidgets.QApplication") as mock_app:
-        mock_app.instance.return_value = Mock()
-        yield mock_app
+    _qt_app_mock.reset_mock()  # Calls recorded by earlier tests don't leak in
+    # Plain attribute swap, restored by monkeypatch after the test
+    monkeypatch.setattr("PyQt6.QtWidgets.QApplication", _qt_app_mock, raising=False)
+    return _qt_app_mock
 
 
-@pytest.fixture
-def sample_workspace_data() -> dict:
-    """Sample workspace data for testing."""
-    return {
+@pytest.fixture(scope="session")
+def sample_workspace_data() -> Mapping[str, object]:
+    """Sample workspace data for testing (read-only)."""
+    return MappingProxyType({
         "monitor": 1,
         "workspace": 2,
         "name": "Work",
         "active": True
-    }
-
-
-@pytest.fixture(autouse=True)
-def setup_test_environment():
-    """Setup test environment before each test."""
-    # Add any global test setup here
-    pass
-
-
-@pytest.fixture(autouse=True)
-def teardown_test_environment():
-    """Cleanup after each test."""
-    yield
-    # Add any global test cleanup here
-    pass 
\ No newline at end of file
+    })
@@ -0,0 +1,72 @@
+"""
+Tests for komorebi client change detection
+"""
+
+import sys
+from pathlib import Path
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from komorebi_client import KomorebiClient
+
+
+def make_state(focused=0, name="Work", layout="BSP"):
+    """Build a minimal ``komorebic state`` dict with one monitor and two workspaces."""
+    workspaces = [
+        {"name": "Work", "layout": {"Default": "BSP"}, "layout_flip": None},
+        {"name": "Personal", "layout": {"Default": "BSP"}, "layout_flip": None},
+    ]
+    workspaces[focused] = {"name": name, "layout": {"Default": layout}, "layout_flip": None}
+    return {
+        "monitors": {
+            "focused": 0,
+            "elements": [{"id": 7, "workspaces": {"focused": focused, "elements": workspaces}}],
+        }
+    }
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Polling client whose state comes from the ``state`` attribute set by each test."""
+    client = KomorebiClient(subscribe=False)
+    client.state = make_state()
+    monkeypatch.setattr(client, "_get_state_cached", lambda force=False: client.state)
+    return client
+
+
+class TestHasWorkspaceChanged:
+    """Test has_workspace_changed change detection."""
+
+    def test_first_check_reports_change(self, client):
+        """Test that the first check reports the initial state as a change."""
+        assert client.has_workspace_changed() is True
+        assert client.has_workspace_changed() is False
+
+    def test_workspace_switch_detected(self, client):
+        """Test that switching workspaces is detected once."""
+        client.has_workspace_changed()
+        client.state = make_state(focused=1, name="Personal")
+        assert client.has_workspace_changed() is True
+        assert client.has_workspace_changed() is False
+
+    def test_state_read_between_checks_does_not_hide_change(self, client):
+        """Test that get_current_workspace_state() between checks doesn't consume a change."""
+        client.has_workspace_changed()
+        client.state = make_state(focused=1, name="Personal")
+        state = client.get_current_workspace_state()
+        assert state.workspace_index == 1
+        assert client.has_workspace_changed() is True
+
+    def test_name_only_change_detected(self, client):
+        """Test that renaming the focused workspace counts as a change."""
+        client.has_workspace_changed()
+        client.state = make_state(name="Renamed")
+        assert client.has_workspace_changed() is True
+
+    def test_layout_only_change_detected(self, client):
+        """Test that changing the focused workspace's layout counts as a change."""
+        client.has_workspace_changed()
+        client.state = make_state(layout="VerticalStack")
+        assert client.has_workspace_changed() is True
@@ -0,0 +1,96 @@
+"""
+Tests for template module
+"""
+
+import sys
+from pathlib import Path
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from template import compile_template
+
+
+VALUES = {"monitor": 1, "workspace": 2, "name": "Work", "layout": "BSP", "flip": "H"}
+
+
+class TestCompileTemplate:
+    """Test compiled templates against str.format behavior."""
+
+    @pytest.mark.parametrize("template", [
+        "{workspace}",
+        "M{monitor} W{workspace}",
+        "M{monitor}:W{workspace} {name}",
+        "W{workspace} {layout} {flip}",
+        "{{literal}} {workspace:02d} {name!r}",
+        "[{monitor}] {name} |",
+        "W{workspace}: ",
+    ])
+    def test_matches_str_format(self, template):
+        """Test that rendering matches str.format plus trailing cleanup."""
+        expected = template.format_map(VALUES).strip().rstrip(":")
+        assert compile_template(template)(VALUES) == expected
+
+    def test_trailing_colon_removed_without_name(self):
+        """Test that an empty {name} does not leave a dangling colon."""
+        render = compile_template("W{workspace}: {name}")
+        assert render(dict(VALUES, name="")) == "W2"
+
+    def test_single_placeholder(self):
+        """Test the lone-placeholder fast path used by the default template."""
+        assert compile_template("{workspace}")(VALUES) == "2"
+        assert compile_template("{name}")(dict(VALUES, name=" Work: ")) == "Work"
+
+    def test_escaped_newline_decoded(self):
+        """Test that a typed "\\n" renders as a line break."""
+        render = compile_template("M{monitor}\\nW{workspace}")
+        assert render(VALUES) == "M1\nW2"
+
+    def test_compiled_once_per_template(self):
+        """Test that the same template string returns the cached renderer."""
+        assert compile_template("M{monitor}") is compile_template("M{monitor}")
+
+    def test_unknown_placeholder_raises(self):
+        """Test that unknown placeholders fail like str.format."""
+        with pytest.raises(KeyError):
+            compile_template("{bogus}")(VALUES)
+
+
+class TestDemoTemplates:
+    """Test the example templates shown by test_templates.py against frozen output."""
+
+    @pytest.mark.parametrize("template,monitor,workspace,name,expected", [
+        ("{workspace}", 1, 2, "Work", "2"),
+        ("{workspace}", 2, 1, "Personal", "1"),
+        ("{workspace}", 1, 3, None, "3"),
+        ("{workspace}", 2, 4, "Gaming", "4"),
+        ("M{monitor} W{workspace}", 1, 2, "Work", "M1 W2"),
+        ("M{monitor} W{workspace}", 2, 1, "Personal", "M2 W1"),
+        ("M{monitor} W{workspace}", 1, 3, None, "M1 W3"),
+        ("M{monitor} W{workspace}", 2, 4, "Gaming", "M2 W4"),
+        ("M{monitor}:W{workspace} {name}", 1, 2, "Work", "M1:W2 Work"),
+        ("M{monitor}:W{workspace} {name}", 2, 1, "Personal", "M2:W1 Personal"),
+        ("M{monitor}:W{workspace} {name}", 1, 3, None, "M1:W3"),
+        ("M{monitor}:W{workspace} {name}", 2, 4, "Gaming", "M2:W4 Gaming"),
+        ("Monitor {monitor}\\nW{workspace}\\n{name}", 1, 2, "Work", "Monitor 1\nW2\nWork"),
+        ("Monitor {monitor}\\nW{workspace}\\n{name}", 2, 1, "Personal", "Monitor 2\nW1\nPersonal"),
+        ("Monitor {monitor}\\nW{workspace}\\n{name}", 1, 3, None, "Monitor 1\nW3"),
+        ("Monitor {monitor}\\nW{workspace}\\n{name}", 2, 4, "Gaming", "Monitor 2\nW4\nGaming"),
+        ("[{monitor}] {workspace} {name}", 1, 2, "Work", "[1] 2 Work"),
+        ("[{monitor}] {workspace} {name}", 2, 1, "Personal", "[2] 1 Personal"),
+        ("[{monitor}] {workspace} {name}", 1, 3, None, "[1] 3"),
+        ("[{monitor}] {workspace} {name}", 2, 4, "Gaming", "[2] 4 Gaming"),
+        ("M{monitor} | W{workspace} | {name}", 1, 2, "Work", "M1 | W2 | Work"),
+        ("M{monitor} | W{workspace} | {name}", 2, 1, "Personal", "M2 | W1 | Personal"),
+        ("M{monitor} | W{workspace} | {name}", 1, 3, None, "M1 | W3 |"),
+        ("M{monitor} | W{workspace} | {name}", 2, 4, "Gaming", "M2 | W4 | Gaming"),
+    ])
+    def test_expected_output(self, template, monitor, workspace, name, expected):
+        """Test each example template and case against its known rendering."""
+        values = {"monitor": monitor, "workspace": workspace, "name": name or ""}
+        assert compile_template(template)(values) == expected
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])